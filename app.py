@@ -0,0 +1,7 @@
+import streamlit as st
+
+from sia.ui import MODES, render_mode
+
+# ===== Sidebar for mode selection =====
+mode = st.sidebar.radio("Select Mode", list(MODES))
+render_mode(mode)
@@ -1,32 +1,12 @@
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 import math
 import matplotlib.pyplot as plt
 from io import BytesIO
 
-# ===== Helper Functions =====
-def to_double_angle_vector(magnitude, axis_deg):
-    axis_rad = math.radians(2 * axis_deg)
-    return np.array([magnitude * math.cos(axis_rad),
-                     magnitude * math.sin(axis_rad)])
-
-def vector_difference_components(mag1, axis1, mag2, axis2):
-    vec1 = to_double_angle_vector(mag1, axis1)
-    vec2 = to_double_angle_vector(mag2, axis2)
-    diff_vec = vec1 - vec2
-    return diff_vec
-
-def vector_difference_magnitude(mag1, axis1, mag2, axis2):
-    diff_vec = vector_difference_components(mag1, axis1, mag2, axis2)
-    return np.linalg.norm(diff_vec)
-
-def double_angle_to_polar(vec):
-    mag = np.linalg.norm(vec)
-    axis_rad = 0.5 * math.atan2(vec[1], vec[0])
-    axis_deg = math.degrees(axis_rad) % 180
-    return mag, axis_deg
+from sia import (vector_difference_magnitude, vector_difference_components, double_angle_to_polar,
+                 REQUIRED_COLS, DEFAULT_SIA_VALUES, missing_columns, compute_sia_errors)
 
 # ===== Sidebar for mode selection =====
 mode = st.sidebar.radio("Select Mode", ["Single Case", "Batch Processing"])
@@ -88,19 +68,11 @@ elif mode == "Batch Processing":
     uploaded_file = st.file_uploader("Upload Excel file", type=["xlsx"])
     if uploaded_file is not None:
         df = pd.read_excel(uploaded_file)
-        required_cols = ["INCISION LOCATION", "ACTUAL SIA MAGNITUDE", "ACTUAL SIA AXIS"]
-        if not all(col in df.columns for col in required_cols):
-            st.error(f"Excel must contain columns: {required_cols}")
+        missing = missing_columns(df)
+        if missing:
+            st.error(f"Excel must contain columns: {REQUIRED_COLS}")
         else:
-            sia_values = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
-            for idx, row in df.iterrows():
-                incision_axis = row['INCISION LOCATION']
-                actual_mag = row['ACTUAL SIA MAGNITUDE']
-                actual_axis = row['ACTUAL SIA AXIS']
-                for val in sia_values:
-                    col_name = f"SIA ERROR {val:.1f}".rstrip('0').rstrip('.') if val != 0 else "SIA ERROR 0"
-                    error_val = vector_difference_magnitude(actual_mag, actual_axis, val, incision_axis)
-                    df.at[idx, col_name] = round(error_val, 3)
+            df = compute_sia_errors(df, DEFAULT_SIA_VALUES)
             
             st.subheader("Calculated SIA Errors")
             st.dataframe(df)
@@ -1,20 +1,9 @@
 
 import streamlit as st
-import numpy as np
 import math
 import matplotlib.pyplot as plt
 
-# ===== Helper Functions =====
-def to_double_angle_vector(magnitude, axis_deg):
-    axis_rad = math.radians(2 * axis_deg)
-    return np.array([magnitude * math.cos(axis_rad),
-                     magnitude * math.sin(axis_rad)])
-
-def vector_difference(mag1, axis1, mag2, axis2):
-    vec1 = to_double_angle_vector(mag1, axis1)
-    vec2 = to_double_angle_vector(mag2, axis2)
-    diff_vec = vec1 - vec2
-    return np.linalg.norm(diff_vec)
+from sia import vector_difference_magnitude
 
 # ===== Streamlit UI =====
 st.title("SIA Error Calculator (App v8 - RE Orientation)")
@@ -32,7 +21,7 @@ expected_axis = incision_axis
 sia_values = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
 errors = {}
 for val in sia_values:
-    errors[val] = vector_difference(actual_mag, actual_axis, val, incision_axis)
+    errors[val] = vector_difference_magnitude(actual_mag, actual_axis, val, incision_axis)
 
 # Find least and most error
 least_sia = min(errors, key=errors.get)
@@ -74,7 +63,7 @@ plot_vector(expected_mag, incision_axis, 'blue', f'Expected ({expected_mag}D @ {
 plot_vector(actual_mag, actual_axis, 'green', f'Actual ({actual_mag}D @ {actual_axis}°)')
 
 # Plot error vector
-err_mag = vector_difference(actual_mag, actual_axis, expected_mag, expected_axis)
+err_mag = vector_difference_magnitude(actual_mag, actual_axis, expected_mag, expected_axis)
 plot_vector(err_mag, actual_axis, 'red', f'Error ({err_mag:.3f}D)', style='--')
 
 # Diagram settings
@@ -1,30 +1,9 @@
 
 import streamlit as st
-import numpy as np
 import math
 import matplotlib.pyplot as plt
 
-# ===== Helper Functions =====
-def to_double_angle_vector(magnitude, axis_deg):
-    axis_rad = math.radians(2 * axis_deg)
-    return np.array([magnitude * math.cos(axis_rad),
-                     magnitude * math.sin(axis_rad)])
-
-def vector_difference_components(mag1, axis1, mag2, axis2):
-    vec1 = to_double_angle_vector(mag1, axis1)
-    vec2 = to_double_angle_vector(mag2, axis2)
-    diff_vec = vec1 - vec2
-    return diff_vec
-
-def vector_difference_magnitude(mag1, axis1, mag2, axis2):
-    diff_vec = vector_difference_components(mag1, axis1, mag2, axis2)
-    return np.linalg.norm(diff_vec)
-
-def double_angle_to_polar(vec):
-    mag = np.linalg.norm(vec)
-    axis_rad = 0.5 * math.atan2(vec[1], vec[0])
-    axis_deg = math.degrees(axis_rad) % 180
-    return mag, axis_deg
+from sia import vector_difference_magnitude, vector_difference_components, double_angle_to_polar
 
 # ===== Streamlit UI =====
 st.title("SIA Error Calculator (App v8 - RE Orientation)")
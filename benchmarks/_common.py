@@ -0,0 +1,46 @@
+"""Shared helpers for the benchmark scripts."""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def synthetic_cohort(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0.0, 1.5, rows),
+            rng.uniform(0.0, 180.0, rows),
+            rng.uniform(0.0, 180.0, rows))
+
+
+def synthetic_frame(rows, seed=0):
+    import pandas as pd
+
+    mag, axis, incision = synthetic_cohort(rows, seed)
+    return pd.DataFrame({
+        "INCISION LOCATION": np.round(incision),
+        "ACTUAL SIA MAGNITUDE": np.round(mag, 2),
+        "ACTUAL SIA AXIS": np.round(axis),
+    })
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(fn):
+    # Peak bytes allocated through Python/NumPy allocators while fn runs
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,88 @@
+"""Scaling benchmark for sia.parallel.
+
+Times sia_error_matrix_parallel on a synthetic cohort for increasing worker
+counts, then the full ``python -m sia --workers N`` run (parse, compute,
+serialize, write) on a synthetic file, and reports the speedup over the
+single-process run:
+
+    python benchmarks/bench_parallel.py --rows 20000000 --sia-step 0.01
+    python benchmarks/bench_parallel.py --rows 0 --file-rows 5000000 --format parquet
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from _common import best_time, synthetic_cohort, synthetic_frame
+
+from sia.parallel import sia_error_matrix_parallel, default_workers
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def worker_counts(max_workers):
+    return sorted({1, 2, 4, 8, max_workers} & set(range(1, max_workers + 1)))
+
+
+def report(workers, elapsed, rows, baseline):
+    print(f"workers={workers:2d}  {elapsed:8.3f} s  {rows / elapsed:12,.0f} rows/s  "
+          f"speedup={baseline / elapsed:5.2f}x")
+
+
+def bench_kernel(args):
+    mag, axis, incision = synthetic_cohort(args.rows)
+    sia_values = np.arange(0.0, 0.5 + args.sia_step / 2, args.sia_step)
+    print(f"kernel: rows={args.rows} candidates={len(sia_values)} shard_rows={args.shard_rows}")
+    baseline = None
+    for workers in worker_counts(args.max_workers):
+        elapsed = best_time(lambda: sia_error_matrix_parallel(mag, axis, incision, sia_values,
+                                                              workers, args.shard_rows), args.repeat)
+        baseline = baseline or elapsed
+        report(workers, elapsed, args.rows, baseline)
+
+
+def bench_file(args):
+    # End to end through the CLI, so parsing and writing in the parent are part of the measurement
+    print(f"python -m sia: rows={args.file_rows} format={args.format} chunksize={args.chunksize}")
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, f"input.{args.format}")
+        output_path = os.path.join(tmp, f"output.{args.format}")
+        df = synthetic_frame(args.file_rows)
+        if args.format == "csv":
+            df.to_csv(input_path, index=False)
+        else:
+            df.to_parquet(input_path, index=False)
+        baseline = None
+        for workers in worker_counts(args.max_workers):
+            command = [sys.executable, "-m", "sia", input_path, output_path, "--workers", str(workers),
+                       "--chunksize", str(args.chunksize)]
+            elapsed = best_time(lambda: subprocess.run(command, env=env, check=True, capture_output=True),
+                                args.repeat)
+            baseline = baseline or elapsed
+            report(workers, elapsed, args.file_rows, baseline)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000, help="kernel benchmark rows (0 skips it)")
+    parser.add_argument("--sia-step", type=float, default=0.1, help="candidate SIA grid step over 0-0.5 D")
+    parser.add_argument("--shard-rows", type=int, default=250_000)
+    parser.add_argument("--file-rows", type=int, default=1_000_000, help="python -m sia benchmark rows (0 skips it)")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--max-workers", type=int, default=default_workers())
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.rows:
+        bench_kernel(args)
+    if args.file_rows:
+        bench_file(args)
+
+
+if __name__ == "__main__":
+    main()
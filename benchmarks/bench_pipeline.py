@@ -0,0 +1,145 @@
+"""End-to-end benchmark for the batch pipeline.
+
+Generates synthetic cohorts, then times parsing, computation (validation plus
+SIA errors) and export separately, recording rows/s and peak memory for each
+stage. The legacy per-row ``df.iterrows()`` loop is timed on a capped sample
+for comparison. Results can be saved as JSON and compared against a previous
+run, exiting non-zero when any stage's throughput regresses past a threshold:
+
+    python benchmarks/bench_pipeline.py --sizes 1000,100000,1000000 --save base.json
+    python benchmarks/bench_pipeline.py --sizes 1000,100000,1000000 --compare base.json
+"""
+import argparse
+import json
+import platform
+import sys
+from io import BytesIO
+
+import numpy as np
+
+from _common import best_time, peak_memory, synthetic_frame
+
+from sia import DEFAULT_SIA_VALUES, compute_sia_errors, vector_difference_magnitude
+from sia.fileio import export_bytes, read_batch_excel
+from sia.validate import validate_inputs
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+XLSX_MAX_ROWS = 1_048_575
+STAGES = ("parse", "compute", "export")
+
+
+def parse(data, fmt):
+    import pandas as pd
+
+    if fmt == "xlsx":
+        return read_batch_excel(data)
+    if fmt == "csv":
+        return pd.read_csv(BytesIO(data))
+    return pd.read_parquet(BytesIO(data))
+
+
+def compute(df, sia_values):
+    df, invalid, _ = validate_inputs(df)
+    return compute_sia_errors(df, sia_values, skip=invalid)
+
+
+def legacy_iterrows(df, sia_values):
+    # The Batch Processing loop as it was before vectorization
+    df = df.copy()
+    for idx, row in df.iterrows():
+        incision_axis = row['INCISION LOCATION']
+        actual_mag = row['ACTUAL SIA MAGNITUDE']
+        actual_axis = row['ACTUAL SIA AXIS']
+        for val in sia_values:
+            col_name = f"SIA ERROR {val:.1f}".rstrip('0').rstrip('.') if val != 0 else "SIA ERROR 0"
+            error_val = vector_difference_magnitude(actual_mag, actual_axis, val, incision_axis)
+            df.at[idx, col_name] = round(float(error_val), 3)
+    return df
+
+
+def run_size(rows, fmt, sia_values, repeat, baseline_rows):
+    df = synthetic_frame(rows)
+    data = export_bytes(df, fmt)
+    parsed = parse(data, fmt)
+    result = compute(parsed, sia_values)
+
+    stages = {
+        "parse": lambda: parse(data, fmt),
+        "compute": lambda: compute(parsed, sia_values),
+        "export": lambda: export_bytes(result, fmt),
+    }
+    record = {"rows": rows, "format": fmt}
+    for name, fn in stages.items():
+        seconds = best_time(fn, repeat)
+        record[name] = {"seconds": seconds, "rows_per_s": rows / seconds, "peak_bytes": peak_memory(fn)}
+
+    sample = parsed.head(min(rows, baseline_rows))
+    seconds = best_time(lambda: legacy_iterrows(sample, sia_values), 1)
+    legacy_rate = len(sample) / seconds
+    record["iterrows_rows_per_s"] = legacy_rate
+    record["compute_speedup_vs_iterrows"] = record["compute"]["rows_per_s"] / legacy_rate
+    return record
+
+
+def print_record(record):
+    print(f"rows={record['rows']:>10,}  format={record['format']}")
+    for name in STAGES:
+        stage = record[name]
+        print(f"  {name:<8} {stage['seconds']:9.4f} s  {stage['rows_per_s']:14,.0f} rows/s  "
+              f"peak {stage['peak_bytes'] / 2**20:9.1f} MiB")
+    print(f"  iterrows baseline {record['iterrows_rows_per_s']:,.0f} rows/s, "
+          f"vectorized compute is {record['compute_speedup_vs_iterrows']:,.0f}x faster")
+
+
+def find_regressions(results, previous, threshold):
+    before = {(r["rows"], r["format"]): r for r in previous["results"]}
+    regressions = []
+    for record in results:
+        old = before.get((record["rows"], record["format"]))
+        if old is None:
+            continue
+        for name in STAGES:
+            ratio = record[name]["rows_per_s"] / old[name]["rows_per_s"]
+            if ratio < 1 - threshold:
+                regressions.append(f"rows={record['rows']} {name}: {ratio:.2f}x of previous throughput")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help=f"comma-separated row counts (full suite: {','.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--format", choices=("csv", "parquet", "xlsx"), default="csv")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline-rows", type=int, default=5_000,
+                        help="rows timed with the legacy iterrows loop (it is extrapolated as a rate)")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="previous results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed fractional throughput drop before failing (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for rows in (int(s) for s in args.sizes.split(",")):
+        if args.format == "xlsx" and rows > XLSX_MAX_ROWS:
+            print(f"rows={rows:>10,}  skipped: xlsx sheets hold at most {XLSX_MAX_ROWS:,} rows")
+            continue
+        record = run_size(rows, args.format, DEFAULT_SIA_VALUES, args.repeat, args.baseline_rows)
+        print_record(record)
+        results.append(record)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "numpy": np.__version__,
+                       "machine": platform.machine(), "results": results}, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = find_regressions(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
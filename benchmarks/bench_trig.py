@@ -0,0 +1,51 @@
+"""Lookup-table vs direct trig benchmark for sia.trig.
+
+Times the double-angle cos/sin, sia_error_matrix and compute_sia_errors on
+whole-degree, half-degree and continuous (off-grid) axes, with and without the
+AxisTable lookup, and checks the results agree:
+
+    python benchmarks/bench_trig.py --rows 2000000
+"""
+import argparse
+
+import numpy as np
+
+from _common import best_time, synthetic_cohort
+
+from sia.batch import DEFAULT_SIA_VALUES, compute_sia_errors
+from sia.core import sia_error_matrix
+from sia.trig import AXIS_TABLE, direct_cos_sin
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    import pandas as pd
+
+    mag, axis, incision = synthetic_cohort(args.rows)
+    print(f"rows={args.rows} table={AXIS_TABLE!r}")
+    for label, quantize in (("whole", lambda a: np.round(a) % 180), ("half", lambda a: np.round(a * 2) / 2 % 180),
+                            ("off-grid", lambda a: a)):
+        actual_axis, incision_axis = quantize(axis), quantize(incision)
+        df = pd.DataFrame({"INCISION LOCATION": incision_axis, "ACTUAL SIA MAGNITUDE": mag,
+                           "ACTUAL SIA AXIS": actual_axis})
+        cases = (
+            ("cos/sin", lambda: direct_cos_sin(actual_axis), lambda: AXIS_TABLE.cos_sin(actual_axis)),
+            ("sia_error_matrix", lambda: sia_error_matrix(mag, actual_axis, incision_axis, DEFAULT_SIA_VALUES),
+             lambda: sia_error_matrix(mag, actual_axis, incision_axis, DEFAULT_SIA_VALUES, AXIS_TABLE)),
+            ("compute_sia_errors", lambda: compute_sia_errors(df, axis_table=None), lambda: compute_sia_errors(df)),
+        )
+        for name, direct, table in cases:
+            direct_s, table_s = best_time(direct, args.repeat), best_time(table, args.repeat)
+            print(f"{label:9s} {name:18s} direct={direct_s * 1000:8.1f} ms  table={table_s * 1000:8.1f} ms  "
+                  f"speedup={direct_s / table_s:5.2f}x")
+        diff = np.abs(sia_error_matrix(mag, actual_axis, incision_axis, DEFAULT_SIA_VALUES)
+                      - sia_error_matrix(mag, actual_axis, incision_axis, DEFAULT_SIA_VALUES, AXIS_TABLE)).max()
+        print(f"{label:9s} max |table - direct| error = {diff:.2e} D")
+
+
+if __name__ == "__main__":
+    main()
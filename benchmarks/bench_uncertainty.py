@@ -0,0 +1,37 @@
+"""Timing benchmark for sia.uncertainty.
+
+Runs the bootstrap and the Monte Carlo noise simulation on a synthetic cohort
+for increasing worker counts:
+
+    python benchmarks/bench_uncertainty.py --rows 50000 --resamples 10000
+"""
+import argparse
+
+from _common import best_time, synthetic_frame
+
+from sia.parallel import default_workers
+from sia.uncertainty import bootstrap_cohort, simulate_measurement_noise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--resamples", type=int, default=10_000, help="bootstrap resamples and noise draws")
+    parser.add_argument("--max-workers", type=int, default=default_workers())
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    df = synthetic_frame(args.rows)
+    print(f"rows={args.rows} resamples={args.resamples}")
+
+    worker_counts = sorted({1, 2, 4, 8, args.max_workers} & set(range(1, args.max_workers + 1)))
+    for name, fn in (("bootstrap", lambda w: bootstrap_cohort(df, n_resamples=args.resamples, seed=0, workers=w)),
+                     ("noise", lambda w: simulate_measurement_noise(df, n_draws=args.resamples, seed=0, workers=w))):
+        for workers in worker_counts:
+            elapsed = best_time(lambda: fn(workers), args.repeat)
+            print(f"{name:9s} workers={workers:2d}  {elapsed:8.3f} s  "
+                  f"{args.rows * args.resamples / elapsed:14,.0f} row-resamples/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Equivalence checks for the vectorized batch math.
+
+Compares sia_error_matrix against a per-row loop over scalar ``math``
+helpers (the pre-vectorization batch code), and the AxisTable lookup
+against direct trig on whole-degree, half-degree and off-grid axes in
+[0, 180), where results must be bit-identical (see sia.trig). Exits
+non-zero when any check fails:
+
+    python benchmarks/check_equivalence.py --rows 20000
+"""
+import argparse
+import math
+import sys
+
+import numpy as np
+
+from _common import synthetic_cohort
+
+from sia.batch import DEFAULT_SIA_VALUES, compute_sia_errors
+from sia.core import sia_error_matrix
+from sia.trig import AXIS_TABLE
+
+VECTORIZED_TOLERANCE = 1e-12
+
+
+def scalar_error(actual_mag, actual_axis, sia, incision_axis):
+    # Reference: double-angle vectors and their difference, one eye and one candidate at a time
+    actual_rad, incision_rad = math.radians(2 * actual_axis), math.radians(2 * incision_axis)
+    diff_x = actual_mag * math.cos(actual_rad) - sia * math.cos(incision_rad)
+    diff_y = actual_mag * math.sin(actual_rad) - sia * math.sin(incision_rad)
+    return math.hypot(diff_x, diff_y)
+
+
+def check_vectorized(mag, axis, incision, sia_values):
+    errors = sia_error_matrix(mag, axis, incision, sia_values)
+    reference = np.array([[scalar_error(m, a, sia, i) for sia in sia_values]
+                          for m, a, i in zip(mag.tolist(), axis.tolist(), incision.tolist())])
+    return np.abs(errors - reference).max()
+
+
+def check_axis_table(mag, axis, incision, sia_values):
+    # Number of result values that differ at all between the table and direct trig
+    import pandas as pd
+
+    table = sia_error_matrix(mag, axis, incision, sia_values, AXIS_TABLE)
+    direct = sia_error_matrix(mag, axis, incision, sia_values)
+    df = pd.DataFrame({"INCISION LOCATION": incision, "ACTUAL SIA MAGNITUDE": mag, "ACTUAL SIA AXIS": axis})
+    frames = (compute_sia_errors(df, sia_values, include_optimum=True, include_vectors=True),
+              compute_sia_errors(df, sia_values, include_optimum=True, include_vectors=True, axis_table=None))
+    mismatched_cells = (~np.isclose(frames[0], frames[1], rtol=0, atol=0, equal_nan=True)).sum()
+    return int((table != direct).sum() + mismatched_cells)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    mag, axis, incision = synthetic_cohort(args.rows, args.seed)
+    failures = 0
+    diff = check_vectorized(mag, axis, incision, DEFAULT_SIA_VALUES)
+    ok = diff <= VECTORIZED_TOLERANCE
+    failures += not ok
+    print(f"{'ok  ' if ok else 'FAIL'} vectorized vs scalar: max |diff| = {diff:.2e} D "
+          f"(tolerance {VECTORIZED_TOLERANCE:.0e})")
+
+    for label, quantize in (("whole", lambda a: np.round(a) % 180), ("half", lambda a: np.round(a * 2) / 2 % 180),
+                            ("off-grid", lambda a: a)):
+        differences = check_axis_table(mag, quantize(axis), quantize(incision), DEFAULT_SIA_VALUES)
+        failures += bool(differences)
+        print(f"{'FAIL' if differences else 'ok  '} axis table vs direct trig, {label} axes: "
+              f"{differences} values differ (must be bit-identical)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
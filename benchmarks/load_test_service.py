@@ -0,0 +1,80 @@
+"""Local load test for sia.service.
+
+Starts the service in-process (or targets --url), fires single-case requests
+from many concurrent clients for a fixed duration and reports requests/s,
+latency percentiles and the service's own micro-batch metrics:
+
+    python benchmarks/load_test_service.py --concurrency 200 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+
+import _common  # noqa: F401  (puts the repo root on sys.path)
+
+from sia.service import create_app
+
+
+async def client(session, url, deadline, latencies, rng):
+    while time.perf_counter() < deadline:
+        payload = {"incision_axis": float(rng.uniform(0, 180)),
+                   "actual_mag": float(rng.uniform(0, 1.5)),
+                   "actual_axis": float(rng.uniform(0, 180))}
+        start = time.perf_counter()
+        async with session.post(f"{url}/v1/error", json=payload) as response:
+            await response.read()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    import aiohttp
+    from aiohttp import web
+
+    runner = None
+    url = args.url
+    if url is None:
+        runner = web.AppRunner(create_app(args.max_batch, args.max_delay_ms / 1000))
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", args.port).start()
+        url = f"http://127.0.0.1:{args.port}"
+
+    latencies = []
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(client(session, url, deadline, latencies, np.random.default_rng(i))
+                               for i in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        async with session.get(f"{url}/metrics") as response:
+            metrics = await response.json()
+
+    if runner is not None:
+        await runner.cleanup()
+
+    ms = np.array(latencies) * 1000
+    print(f"concurrency={args.concurrency} duration={elapsed:.1f}s requests={len(ms)}")
+    print(f"throughput {len(ms) / elapsed:,.0f} req/s")
+    print(f"latency p50={np.percentile(ms, 50):.2f} ms p95={np.percentile(ms, 95):.2f} ms "
+          f"p99={np.percentile(ms, 99):.2f} ms")
+    print("service metrics", json.dumps(metrics, indent=2))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="target an already running service instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--max-batch", type=int, default=1024)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""UI-free SIA error engine shared by the Streamlit apps and batch jobs.
+
+Only NumPy is imported here; streamlit, pandas and matplotlib are left to the
+front-ends that need them.
+"""
+from .core import (
+    to_double_angle_vector,
+    vector_difference_components,
+    vector_difference_magnitude,
+    double_angle_to_polar,
+    sia_error_matrix,
+    sia_error_components,
+    incision_projection,
+)
+from .batch import (
+    REQUIRED_COLS,
+    DEFAULT_SIA_VALUES,
+    sia_error_column_name,
+    missing_columns,
+    compute_sia_errors,
+)
+
+__all__ = [
+    "to_double_angle_vector",
+    "vector_difference_components",
+    "vector_difference_magnitude",
+    "double_angle_to_polar",
+    "sia_error_matrix",
+    "sia_error_components",
+    "incision_projection",
+    "REQUIRED_COLS",
+    "DEFAULT_SIA_VALUES",
+    "sia_error_column_name",
+    "missing_columns",
+    "compute_sia_errors",
+]
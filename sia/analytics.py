@@ -0,0 +1,90 @@
+"""Cohort-level statistics and double-angle plots over whole batches.
+
+All per-row quantities (double-angle components of the actual SIA and the
+error for every candidate SIA) are computed as arrays up front, then reduced
+with a single pandas group-by aggregation. Only rows that pass validation
+(see sia.validate.accepted_rows) are included.
+"""
+import numpy as np
+
+from .batch import DEFAULT_SIA_VALUES, column_values, input_arrays, sia_error_column_name
+from .core import double_angle_to_polar, sia_error_matrix, to_double_angle_vector
+from .validate import accepted_rows
+
+COHORT_COL = "COHORT"
+
+
+def cohort_summary(df, by=None, sia_values=DEFAULT_SIA_VALUES, decimals=3):
+    # One row per group: N, double-angle centroid of actual SIA (X/Y, magnitude, axis), its SD,
+    # and mean/median error for each candidate SIA. Rows flagged by validation are ignored; errors come
+    # from the frame's SIA ERROR columns when it has them.
+    import pandas as pd
+
+    df = accepted_rows(df)
+    mag, axis, incision = input_arrays(df)
+    error_names = [sia_error_column_name(v) for v in sia_values]
+    if all(name in df.columns for name in error_names):
+        errors = np.column_stack([column_values(df, name) for name in error_names])
+    else:
+        errors = sia_error_matrix(mag, axis, incision, sia_values)
+    work = pd.DataFrame(np.column_stack([to_double_angle_vector(mag, axis), errors]),
+                        columns=["X", "Y", *error_names], index=df.index)
+    keys = ([pd.Series(column_values(df, col), index=df.index, name=col) if str(df[col].dtype) == "Int16"
+             else df[col] for col in by] if by else [pd.Series("ALL", index=df.index, name=COHORT_COL)])
+
+    spec = {"X": ["count", "mean", "std"], "Y": ["mean", "std"]}
+    spec.update({name: ["mean", "median"] for name in error_names})
+    stats = work.groupby(keys, sort=True).agg(spec)
+
+    summary = pd.DataFrame(index=stats.index)
+    summary["N"] = stats[("X", "count")]
+    summary["CENTROID X"] = stats[("X", "mean")]
+    summary["CENTROID Y"] = stats[("Y", "mean")]
+    centroid_mag, centroid_axis = double_angle_to_polar(summary[["CENTROID X", "CENTROID Y"]].to_numpy())
+    summary["CENTROID MAGNITUDE"] = centroid_mag
+    summary["CENTROID AXIS"] = centroid_axis
+    summary["SD X"] = stats[("X", "std")]
+    summary["SD Y"] = stats[("Y", "std")]
+    for name in error_names:
+        summary[f"MEAN {name}"] = stats[(name, "mean")]
+        summary[f"MEDIAN {name}"] = stats[(name, "median")]
+    if decimals is not None:
+        summary = summary.round(decimals)
+        # Rounding can carry an axis just below 180 up to 180.0
+        summary["CENTROID AXIS"] %= 180
+    return summary.reset_index()
+
+
+def double_angle_scatter(df, max_points=20_000, mode="auto", gridsize=60, seed=0):
+    # Scatter of actual SIA in double-angle space with the cohort centroid. Beyond max_points,
+    # "auto" and "hexbin" bin the points; "scatter" plots a seeded random sample instead.
+    from matplotlib.figure import Figure
+
+    mag, axis, _ = input_arrays(accepted_rows(df))
+    vec = to_double_angle_vector(mag, axis)
+    vec = vec[np.isfinite(vec).all(axis=1)]
+    centroid = vec.mean(axis=0) if len(vec) else np.zeros(2)
+    limit = max(1.0, float(np.abs(vec).max())) * 1.05 if len(vec) else 1.0
+
+    fig = Figure(figsize=(6, 6))
+    ax = fig.subplots()
+    if len(vec) > max_points and mode in ("auto", "hexbin"):
+        hb = ax.hexbin(vec[:, 0], vec[:, 1], gridsize=gridsize, bins="log", mincnt=1, cmap="viridis",
+                       extent=(-limit, limit, -limit, limit))
+        fig.colorbar(hb, ax=ax, label="eyes per bin", shrink=0.8)
+    else:
+        if len(vec) > max_points:
+            vec = vec[np.random.default_rng(seed).choice(len(vec), max_points, replace=False)]
+        ax.scatter(vec[:, 0], vec[:, 1], s=6, alpha=0.4, color='green', linewidths=0, rasterized=True)
+    centroid_mag, centroid_axis = double_angle_to_polar(centroid)
+    ax.plot(*centroid, marker='X', markersize=12, color='red', linestyle='none',
+            label=f'Centroid ({centroid_mag:.3f}D @ {centroid_axis:.1f}°)')
+    ax.axhline(0, linestyle=':', color='gray')
+    ax.axvline(0, linestyle=':', color='gray')
+    ax.set_xlim(-limit, limit)
+    ax.set_ylim(-limit, limit)
+    ax.set_aspect('equal', adjustable='box')
+    ax.set_xlabel("Double-angle X (D)")
+    ax.set_ylabel("Double-angle Y (D)")
+    ax.legend(loc='upper right')
+    return fig
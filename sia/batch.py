@@ -0,0 +1,162 @@
+"""DataFrame-level helpers for the Batch Processing mode.
+
+With include_vectors, every candidate SIA also gets the components of its
+error vector, taken from the same pass that computes the magnitudes:
+``X``/``Y`` in double-angle space, the error ``AXIS`` in degrees, and the
+with-the-rule / against-the-rule split of ``X``. A positive ``X`` is a
+flattening along 0/180 (a relative steepening at 90 degrees), reported as
+``WTR``; a negative ``X`` is reported as ``ATR``. ``Y`` is the oblique part.
+"""
+import numpy as np
+
+from .core import sia_error_components
+from .grid import optimal_sia
+from .trig import AXIS_TABLE
+
+REQUIRED_COLS = ["INCISION LOCATION", "ACTUAL SIA MAGNITUDE", "ACTUAL SIA AXIS"]
+DEFAULT_SIA_VALUES = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5]
+# int16 fixed-point columns (see sia.compact) hold hundredths of a diopter / degree
+CENTI_SCALE = 100
+
+
+def sia_error_column_name(val):
+    # "SIA ERROR 0", "SIA ERROR 0.1", ...; :g keeps finer grid values such as 0.45 distinct
+    return f"SIA ERROR {val:g}" if val != 0 else "SIA ERROR 0"
+
+
+def missing_columns(df):
+    return [col for col in REQUIRED_COLS if col not in df.columns]
+
+
+OPTIMAL_SIA_COL = "OPTIMAL SIA"
+OPTIMAL_SIA_ERROR_COL = "OPTIMAL SIA ERROR"
+ERROR_VECTOR_PARTS = ("X", "Y", "AXIS", "WTR", "ATR")
+LAYOUTS = ("wide", "long")
+CANDIDATE_SIA_COL = "CANDIDATE SIA"
+ROW_COL = "ROW"
+
+
+def error_vector_column_name(val, part):
+    # "SIA ERROR 0.1 X", "SIA ERROR 0.1 AXIS", ...
+    return f"{sia_error_column_name(val)} {part}"
+
+
+def result_column_names(sia_values, include_optimum=False, include_vectors=False):
+    names = [sia_error_column_name(val) for val in sia_values]
+    if include_optimum:
+        names += [OPTIMAL_SIA_COL, OPTIMAL_SIA_ERROR_COL]
+    if include_vectors:
+        names += [error_vector_column_name(val, part) for val in sia_values for part in ERROR_VECTOR_PARTS]
+    return names
+
+
+def column_values(df, col):
+    # float64 values of a column in D / degrees, decoding int16 centi-unit columns
+    series = df[col]
+    if str(series.dtype) == "Int16":
+        return series.to_numpy(dtype=float, na_value=np.nan) / CENTI_SCALE
+    return series.to_numpy(dtype=float)
+
+
+def input_arrays(df):
+    return (column_values(df, 'ACTUAL SIA MAGNITUDE'),
+            column_values(df, 'ACTUAL SIA AXIS'),
+            column_values(df, 'INCISION LOCATION'))
+
+
+def attach_columns(df, columns):
+    # One concat instead of a column insert per name, so wide grids don't fragment the frame
+    import pandas as pd
+
+    new = pd.DataFrame(columns, index=df.index)
+    return pd.concat([df.drop(columns=[c for c in new.columns if c in df.columns]), new], axis=1)
+
+
+def sia_error_columns(errors, sia_values, decimals=3):
+    if decimals is not None:
+        errors = np.round(errors, decimals)
+    return {sia_error_column_name(val): errors[:, j] for j, val in enumerate(sia_values)}
+
+
+def error_vector_columns(diff_x, diff_y, sia_values, decimals=3):
+    # X, Y, AXIS, WTR, ATR per candidate from the (rows x candidate) error components
+    parts = {"X": diff_x, "Y": diff_y, "AXIS": np.degrees(0.5 * np.arctan2(diff_y, diff_x)),
+             "WTR": np.maximum(diff_x, 0.0), "ATR": np.maximum(-diff_x, 0.0)}
+    if decimals is not None:
+        # + 0.0 turns the -0.0 left by rounding tiny negatives into 0.0
+        parts = {part: np.round(values, decimals) + 0.0 for part, values in parts.items()}
+    parts["AXIS"] %= 180
+    return {error_vector_column_name(val, part): parts[part][:, j]
+            for j, val in enumerate(sia_values) for part in ERROR_VECTOR_PARTS}
+
+
+def optimum_columns(actual_mag, actual_axis, incision_axis, sia_values, decimals=3, axis_table=AXIS_TABLE):
+    # Exact error-minimizing SIA from the double-angle projection, clipped to the grid range
+    sia, error = optimal_sia(actual_mag, actual_axis, incision_axis, min(sia_values), max(sia_values), axis_table)
+    if decimals is not None:
+        sia, error = np.round(sia, decimals), np.round(error, decimals)
+    return {OPTIMAL_SIA_COL: sia, OPTIMAL_SIA_ERROR_COL: error}
+
+
+def blank_rows(columns, skip):
+    # Rows flagged in the boolean skip mask get NaN in every result column
+    if skip is not None and skip.any():
+        for values in columns.values():
+            values[skip] = np.nan
+    return columns
+
+
+def result_columns(arrays, sia_values, decimals=3, include_optimum=False, include_vectors=False,
+                   axis_table=AXIS_TABLE):
+    # All result columns for (mag, axis, incision) arrays, from one evaluation of the error components
+    diff_x, diff_y = sia_error_components(*arrays, sia_values, axis_table)
+    columns = sia_error_columns(np.hypot(diff_x, diff_y), sia_values, decimals)
+    if include_optimum:
+        columns.update(optimum_columns(*arrays, sia_values, decimals, axis_table))
+    if include_vectors:
+        columns.update(error_vector_columns(diff_x, diff_y, sia_values, decimals))
+    return columns
+
+
+def long_layout(df, columns, sia_values, row_offset=0):
+    # One row per (input row, candidate SIA): input columns and per-row results are repeated,
+    # per-candidate results become "SIA ERROR", "SIA ERROR X", ... next to CANDIDATE SIA.
+    # ROW is the 0-based position of the input row; chunked runs pass the chunk's first row as row_offset.
+    clashes = [name for name in (ROW_COL, CANDIDATE_SIA_COL) if name in df.columns]
+    if clashes:
+        raise ValueError(f"Input columns {clashes} are reserved in the long layout; rename them or use the "
+                         f"wide layout")
+    k = len(sia_values)
+    per_candidate = {}
+    for part in ("",) + ERROR_VECTOR_PARTS:
+        names = [error_vector_column_name(val, part) if part else sia_error_column_name(val) for val in sia_values]
+        if all(name in columns for name in names):
+            per_candidate[f"SIA ERROR {part}".strip()] = np.column_stack([columns.pop(name) for name in names]).ravel()
+    repeat = np.repeat(np.arange(len(df)), k)
+    long = df.iloc[repeat].reset_index(drop=True)
+    long.insert(0, ROW_COL, repeat + row_offset)
+    extra = {name: np.asarray(values)[repeat] for name, values in columns.items()}
+    extra[CANDIDATE_SIA_COL] = np.tile(np.asarray(sia_values, dtype=float), len(df))
+    extra.update(per_candidate)
+    return attach_columns(long, extra)
+
+
+def wide_to_long(df, sia_values, row_offset=0):
+    # Long layout of an already computed wide result frame
+    names = [name for name in result_column_names(sia_values, True, True) if name in df.columns]
+    columns = {name: df[name].to_numpy() for name in names}
+    return long_layout(df.drop(columns=names), columns, sia_values, row_offset)
+
+
+def compute_sia_errors(df, sia_values=DEFAULT_SIA_VALUES, decimals=3, include_optimum=False, skip=None,
+                       axis_table=AXIS_TABLE, include_vectors=False, layout="wide", row_offset=0):
+    # Returns df with one "SIA ERROR <val>" column per candidate SIA appended (see module docstring for
+    # include_vectors), or the long layout with one row per candidate (see long_layout for row_offset).
+    # Whole/half-degree axes use the cos/sin lookup table; pass axis_table=None for direct trig.
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unsupported layout '{layout}', expected one of {LAYOUTS}")
+    columns = blank_rows(result_columns(input_arrays(df), sia_values, decimals, include_optimum,
+                                        include_vectors, axis_table), skip)
+    if layout == "long":
+        return long_layout(df, columns, sia_values, row_offset)
+    return attach_columns(df, columns)
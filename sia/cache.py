@@ -0,0 +1,81 @@
+"""Content-addressed, size-bounded LRU cache for batch upload results.
+
+Entries are keyed on a SHA-256 of the uploaded bytes plus the SIA grid and
+output options, so re-uploading the same workbook, or a Streamlit rerun
+triggered by an unrelated widget, returns the stored result without
+re-parsing, recomputing or re-exporting.
+"""
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def upload_cache_key(data, sia_values, *options):
+    return (hashlib.sha256(data).hexdigest(), tuple(float(v) for v in sia_values)) + options
+
+
+def estimate_nbytes(value):
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if hasattr(value, "memory_usage"):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    # Least recently used entries are evicted once the total size exceeds max_bytes
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes=None):
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return False
+            while self._entries and self._nbytes + nbytes > self.max_bytes:
+                self._nbytes -= self._entries.popitem(last=False)[1][1]
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
@@ -0,0 +1,109 @@
+"""Command-line batch runner: ``python -m sia INPUT OUTPUT``."""
+import argparse
+import sys
+
+from .batch import DEFAULT_SIA_VALUES, LAYOUTS
+from .grid import make_sia_grid
+from .incremental import IncrementalStore
+from .instrument import RunTimer, profile_call
+from .parallel import process_file_parallel
+from .stream import DEFAULT_CHUNKSIZE, FORMATS, process_file
+
+
+def parse_sia_values(text):
+    try:
+        return [float(v) for v in text.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid SIA value list: '{text}'")
+
+
+def parse_sia_grid(text):
+    try:
+        start, stop, step = (float(v) for v in text.split(":"))
+        return list(make_sia_grid(start, stop, step))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid SIA grid '{text}', expected START:STOP:STEP")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m sia",
+        description="Compute SIA ERROR columns for a CSV or Parquet file in fixed-size chunks.")
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output", help="output .csv or .parquet file")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"rows per chunk (default: {DEFAULT_CHUNKSIZE})")
+    grid = parser.add_mutually_exclusive_group()
+    grid.add_argument("--sia-values", type=parse_sia_values, default=DEFAULT_SIA_VALUES,
+                      help="comma-separated candidate SIA values in D (default: 0,0.1,...,0.5)")
+    grid.add_argument("--sia-grid", dest="sia_values", type=parse_sia_grid, metavar="START:STOP:STEP",
+                      help="inclusive candidate SIA grid as START:STOP:STEP, e.g. 0:2:0.001")
+    parser.add_argument("--optimum", action="store_true",
+                        help="also write the exact error-minimizing SIA within the grid range")
+    parser.add_argument("--vectors", action="store_true",
+                        help="also write each candidate's error vector: double-angle X/Y, axis and WTR/ATR parts")
+    parser.add_argument("--layout", choices=LAYOUTS, default="wide",
+                        help="wide: one row per eye; long: one row per eye and candidate SIA (default: wide)")
+    parser.add_argument("--decimals", type=int, default=3,
+                        help="round errors to this many decimals (default: 3)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes; 0 uses every CPU core (default: 1, serial)")
+    parser.add_argument("--state", metavar="PATH",
+                        help="Parquet file of previously computed rows; only new or changed rows are "
+                             "recomputed and the file is updated afterwards")
+    parser.add_argument("--timings", metavar="PATH",
+                        help="write per-stage timings, rows/s and peak RSS as JSON ('-' for stderr)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="also record per-stage tracemalloc peaks in the timings (slows the run considerably)")
+    parser.add_argument("--profile", metavar="PATH", help="run under cProfile and write a .prof file")
+    parser.add_argument("--input-format", choices=FORMATS, help="override format detected from extension")
+    parser.add_argument("--output-format", choices=FORMATS, help="override format detected from extension")
+    return parser
+
+
+def run(args, timer):
+    if args.state:
+        store = IncrementalStore.load(args.state)
+        rows = process_file(args.input, args.output, args.sia_values, args.chunksize,
+                            args.input_format, args.output_format, args.decimals, args.optimum,
+                            store, timer, args.vectors, args.layout)
+        store.save(args.state)
+    elif args.workers == 1:
+        rows = process_file(args.input, args.output, args.sia_values, args.chunksize,
+                            args.input_format, args.output_format, args.decimals, args.optimum,
+                            timer=timer, include_vectors=args.vectors, layout=args.layout)
+    else:
+        with timer.stage("parallel") as info:
+            rows = process_file_parallel(args.input, args.output, args.sia_values, args.chunksize,
+                                         args.input_format, args.output_format, args.decimals,
+                                         args.optimum, workers=args.workers or None,
+                                         include_vectors=args.vectors, layout=args.layout)
+            info["rows"] = rows
+    return rows
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.state and args.workers != 1:
+        parser.error("--state runs in a single process and cannot be combined with --workers")
+    if args.trace_memory and not args.timings:
+        parser.error("--trace-memory only applies together with --timings")
+    timer = RunTimer(track_memory=args.trace_memory)
+    try:
+        if args.profile:
+            rows, dump, _ = profile_call(run, args, timer)
+            with open(args.profile, "wb") as f:
+                f.write(dump)
+        else:
+            rows = run(args, timer)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(f"Wrote {rows} rows to {args.output}", file=sys.stderr)
+    if args.timings == "-":
+        print(timer.to_json(indent=2), file=sys.stderr)
+    elif args.timings:
+        with open(args.timings, "w") as f:
+            f.write(timer.to_json(indent=2))
+    return 0
@@ -0,0 +1,105 @@
+"""Compact result storage and memory-budgeted chunked computation.
+
+Inputs and results can be stored as float32, or as int16 fixed point in
+hundredths of a diopter / degree (pandas nullable Int16, so blanked rows stay
+missing). int16 centi-units resolve 0.01 D and 0.01 degrees and hold values
+up to 327.67; float32 keeps about 7 significant digits, well below the 0.001 D
+output rounding. batch.column_values decodes either layout back to float64.
+
+With a memory budget, the float64 working set of the error matrix is bounded
+by computing row chunks into one preallocated output array.
+"""
+import numpy as np
+
+from .batch import (CENTI_SCALE, DEFAULT_SIA_VALUES, REQUIRED_COLS, blank_rows, column_values, input_arrays,
+                    result_column_names, result_columns)
+from .trig import AXIS_TABLE
+
+RESULT_DTYPES = ("float64", "float32", "int16")
+INT16_MAX = np.iinfo(np.int16).max
+
+
+def working_bytes_per_row(n_candidates, include_vectors=False):
+    # float64 temporaries of sia_error_matrix + rounding, per input row; the error-vector parts
+    # (X, Y, AXIS, WTR, ATR and their rounded copies) roughly double that
+    return ((12 if include_vectors else 6) * n_candidates + 8) * 8
+
+
+def rows_per_chunk(n_candidates, memory_budget, include_vectors=False):
+    return max(1, int(memory_budget // working_bytes_per_row(n_candidates, include_vectors)))
+
+
+def storage_bytes(n_rows, n_columns, dtype):
+    itemsize = {"float64": 8, "float32": 4, "int16": 3}[dtype]  # Int16 carries a 1-byte mask
+    return n_rows * n_columns * itemsize
+
+
+def _encode_centi(values):
+    import pandas as pd
+
+    missing = np.isnan(values)
+    scaled = np.round(np.where(missing, 0.0, values) * CENTI_SCALE)
+    if np.abs(scaled).max(initial=0) > INT16_MAX:
+        raise ValueError(f"values above {INT16_MAX / CENTI_SCALE} do not fit int16 centi-units; use float32")
+    return pd.arrays.IntegerArray(scaled.astype(np.int16), missing)
+
+
+def encode_columns(columns, dtype):
+    # dict of float64 arrays -> dict of arrays in the requested storage dtype
+    if dtype == "float64":
+        return columns
+    if dtype == "float32":
+        return {name: np.asarray(values, dtype=np.float32) for name, values in columns.items()}
+    if dtype == "int16":
+        return {name: _encode_centi(np.asarray(values, dtype=float)) for name, values in columns.items()}
+    raise ValueError(f"Unsupported result dtype '{dtype}', expected one of {RESULT_DTYPES}")
+
+
+def decode_frame(df):
+    # float64 copy of every int16 centi-unit column, e.g. before export
+    encoded = [col for col in df.columns if str(df[col].dtype) == "Int16"]
+    if not encoded:
+        return df
+    return df.assign(**{col: column_values(df, col) for col in encoded})
+
+
+def compute_sia_errors_compact(df, sia_values=DEFAULT_SIA_VALUES, decimals=3, include_optimum=False,
+                               skip=None, dtype="float32", memory_budget=None, axis_table=AXIS_TABLE,
+                               include_vectors=False):
+    # Like batch.compute_sia_errors, but inputs and results are stored in dtype and the float64
+    # working set is kept under memory_budget bytes by computing into a preallocated output in row chunks
+    import pandas as pd
+
+    if dtype not in RESULT_DTYPES:
+        raise ValueError(f"Unsupported result dtype '{dtype}', expected one of {RESULT_DTYPES}")
+    names = result_column_names(sia_values, include_optimum, include_vectors)
+    mag, axis, incision = input_arrays(df)
+    n_rows = len(df)
+    step = n_rows
+    if memory_budget is not None and n_rows * working_bytes_per_row(len(sia_values), include_vectors) > memory_budget:
+        step = rows_per_chunk(len(sia_values), memory_budget, include_vectors)
+
+    # Column-major, so each result column is one contiguous row of out that pandas can use without copying
+    out = np.empty((len(names), n_rows), dtype=np.int16 if dtype == "int16" else dtype)
+    missing = np.zeros(out.shape, dtype=bool) if dtype == "int16" else None
+    for start in range(0, n_rows, max(step, 1)):
+        rows = slice(start, start + step)
+        columns = result_columns((mag[rows], axis[rows], incision[rows]), sia_values, decimals, include_optimum,
+                                 include_vectors, axis_table)
+        blank_rows(columns, None if skip is None else skip[rows])
+        for j, name in enumerate(names):
+            if dtype == "int16":
+                encoded = _encode_centi(columns[name])
+                out[j, rows] = encoded._data
+                missing[j, rows] = encoded._mask
+            else:
+                out[j, rows] = columns[name]
+
+    if dtype == "int16":
+        results = pd.DataFrame({name: pd.arrays.IntegerArray(out[j], missing[j]) for j, name in enumerate(names)},
+                               index=df.index, copy=False)
+    else:
+        results = pd.DataFrame(out.T, columns=names, index=df.index, copy=False)
+    inputs = encode_columns({col: column_values(df, col) for col in REQUIRED_COLS}, dtype)
+    df = df.drop(columns=[c for c in names if c in df.columns]).assign(**inputs)
+    return pd.concat([df, results], axis=1)
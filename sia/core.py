@@ -0,0 +1,69 @@
+"""Double-angle vector math for SIA error calculations.
+
+Every function accepts plain scalars or NumPy arrays. Vectors are stored with
+their (x, y) components on the last axis, so a scalar input gives a shape (2,)
+vector and an array of N axes gives an (N, 2) array.
+
+Functions taking ``axis_table`` read cos/sin of the doubled axis from a
+sia.trig.AxisTable when one is given, instead of evaluating them.
+"""
+import numpy as np
+
+from .trig import direct_cos_sin
+
+
+def double_angle_cos_sin(axis_deg, axis_table=None):
+    return direct_cos_sin(axis_deg) if axis_table is None else axis_table.cos_sin(axis_deg)
+
+
+def to_double_angle_vector(magnitude, axis_deg, axis_table=None):
+    cos, sin = double_angle_cos_sin(axis_deg, axis_table)
+    magnitude = np.asarray(magnitude, dtype=float)
+    return np.stack([magnitude * cos, magnitude * sin], axis=-1)
+
+
+def vector_difference_components(mag1, axis1, mag2, axis2):
+    vec1 = to_double_angle_vector(mag1, axis1)
+    vec2 = to_double_angle_vector(mag2, axis2)
+    diff_vec = vec1 - vec2
+    return diff_vec
+
+
+def vector_difference_magnitude(mag1, axis1, mag2, axis2):
+    diff_vec = vector_difference_components(mag1, axis1, mag2, axis2)
+    return np.linalg.norm(diff_vec, axis=-1)
+
+
+def double_angle_to_polar(vec):
+    vec = np.asarray(vec, dtype=float)
+    mag = np.linalg.norm(vec, axis=-1)
+    axis_rad = 0.5 * np.arctan2(vec[..., 1], vec[..., 0])
+    axis_deg = np.degrees(axis_rad) % 180
+    return mag, axis_deg
+
+
+def incision_projection(actual_mag, actual_axis, incision_axis, axis_table=None):
+    # Components of the actual SIA along and across the incision axis, in double-angle space
+    actual_mag = np.asarray(actual_mag, dtype=float)
+    cos, sin = double_angle_cos_sin(np.asarray(actual_axis, dtype=float) - np.asarray(incision_axis, dtype=float),
+                                    axis_table)
+    return actual_mag * cos, actual_mag * sin
+
+
+def sia_error_components(actual_mag, actual_axis, incision_axis, sia_values, axis_table=None):
+    # Same math as vector_difference_components, broadcast to (rows x candidate SIA); returns (x, y)
+    actual_mag = np.asarray(actual_mag, dtype=float)
+    actual_cos, actual_sin = double_angle_cos_sin(actual_axis, axis_table)
+    incision_cos, incision_sin = double_angle_cos_sin(incision_axis, axis_table)
+    sia = np.asarray(sia_values, dtype=float)
+
+    actual_x = (actual_mag * actual_cos)[:, None]
+    actual_y = (actual_mag * actual_sin)[:, None]
+    diff_x = actual_x - sia[None, :] * incision_cos[:, None]
+    diff_y = actual_y - sia[None, :] * incision_sin[:, None]
+    return diff_x, diff_y
+
+
+def sia_error_matrix(actual_mag, actual_axis, incision_axis, sia_values, axis_table=None):
+    # Same math as vector_difference_magnitude, broadcast to (rows x candidate SIA)
+    return np.hypot(*sia_error_components(actual_mag, actual_axis, incision_axis, sia_values, axis_table))
@@ -0,0 +1,172 @@
+"""Fast-path Excel ingestion and CSV/Parquet/xlsx export for batch results.
+
+Reading pulls only the required input columns. python-calamine is used when it
+is installed; otherwise openpyxl's read-only streaming parser is walked
+directly instead of materializing the whole workbook. xlsx export uses
+xlsxwriter's constant_memory mode, which flushes each row to disk as it is
+written.
+"""
+import math
+import os
+import re
+import tempfile
+import zipfile
+from io import BytesIO
+
+from .batch import REQUIRED_COLS
+
+# Rows converted to Python values at a time during xlsx export, so memory stays flat with constant_memory
+XLSX_WRITE_ROWS = 10_000
+# Same display format pandas' ExcelWriter uses for datetimes
+XLSX_DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+EXPORT_FORMATS = {
+    "xlsx": XLSX_MIME,
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def has_calamine():
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _as_source(source):
+    return BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def excel_sheet_names(source):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(_as_source(source), read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _read_required_openpyxl(source, sheet_name=0):
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, ())
+        positions = {}
+        for i, name in enumerate(header):
+            if name in REQUIRED_COLS:
+                positions.setdefault(name, i)
+        columns = {name: [] for name in positions}
+        # Blank rows are kept as NaN rows and only trailing ones are dropped, like pandas' Excel readers,
+        # so row positions and invalid-row counts don't depend on the installed engine
+        n_read = n_rows = 0
+        for row in rows:
+            n_read += 1
+            for name, i in positions.items():
+                columns[name].append(row[i] if i < len(row) else None)
+            if any(v is not None for v in row):
+                n_rows = n_read
+    finally:
+        workbook.close()
+    return pd.DataFrame({name: values[:n_rows] for name, values in columns.items()})
+
+
+def read_batch_excel(source, required_only=True, sheet_name=0):
+    # source may be a path, a file-like object or the raw uploaded bytes; sheet_name is an index or a name
+    import pandas as pd
+
+    source = _as_source(source)
+    usecols = (lambda c: c in REQUIRED_COLS) if required_only else None
+    if has_calamine():
+        return pd.read_excel(source, engine="calamine", usecols=usecols, sheet_name=sheet_name)
+    if required_only:
+        return _read_required_openpyxl(source, sheet_name)
+    return pd.read_excel(source, engine="openpyxl", sheet_name=sheet_name)
+
+
+def _cell_values(series):
+    # xlsxwriter can't write NaN/inf, NaT or pd.NA; leave those cells blank like pandas does
+    missing = series.isna().to_numpy()
+    return [None if is_missing or (isinstance(v, float) and not math.isfinite(v)) else v
+            for v, is_missing in zip(series.tolist(), missing)]
+
+
+def xlsx_sheet_titles(names):
+    # Excel sheet names: at most 31 characters, none of []:*?/\ and unique ignoring case
+    titles, seen = [], set()
+    for name in names:
+        base = re.sub(r"[\[\]:*?/\\]", "_", str(name)).strip("'")[:31] or "Sheet"
+        title, n = base, 1
+        while title.lower() in seen:
+            n += 1
+            suffix = f" ({n})"
+            title = base[:31 - len(suffix)] + suffix
+        seen.add(title.lower())
+        titles.append(title)
+    return titles
+
+
+def to_xlsx_bytes(df, sheet_name="Results"):
+    return to_xlsx_sheets_bytes({sheet_name: df})
+
+
+def to_xlsx_sheets_bytes(sheets):
+    # sheets maps sheet name -> DataFrame, or is a list of (name, DataFrame) pairs;
+    # names are made valid and unique with xlsx_sheet_titles
+    import xlsxwriter
+
+    # constant_memory streams rows to a temp file, which in_memory would override
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        sheets = list(sheets.items() if hasattr(sheets, "items") else sheets)
+        workbook = xlsxwriter.Workbook(path, {"constant_memory": True,
+                                              "default_date_format": XLSX_DATETIME_FORMAT})
+        for title, (_, df) in zip(xlsx_sheet_titles(name for name, _ in sheets), sheets):
+            worksheet = workbook.add_worksheet(title)
+            worksheet.write_row(0, 0, [str(c) for c in df.columns])
+            for start in range(0, len(df), XLSX_WRITE_ROWS):
+                part = df.iloc[start:start + XLSX_WRITE_ROWS]
+                columns = [_cell_values(part.iloc[:, i]) for i in range(part.shape[1])]
+                for r, row in enumerate(zip(*columns), start=start + 1):
+                    worksheet.write_row(r, 0, row)
+        workbook.close()
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(path)
+
+
+def to_csv_bytes(df):
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def to_parquet_bytes(df):
+    buffer = BytesIO()
+    df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+def export_bytes(df, fmt="xlsx"):
+    if fmt == "xlsx":
+        return to_xlsx_bytes(df)
+    if fmt == "csv":
+        return to_csv_bytes(df)
+    if fmt == "parquet":
+        return to_parquet_bytes(df)
+    raise ValueError(f"Unsupported export format '{fmt}', expected one of {list(EXPORT_FORMATS)}")
+
+
+def zip_bytes(files):
+    # files maps archive member name -> bytes
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
@@ -0,0 +1,45 @@
+"""Candidate-SIA grids and the closed-form error-minimizing SIA.
+
+For a candidate SIA ``s`` placed on the incision axis, the error is
+``|A - s * u|`` where ``A`` is the actual SIA double-angle vector and ``u`` the
+unit double-angle vector of the incision axis. This is a convex quadratic in
+``s`` with its minimum at the projection ``s* = A . u = |A| cos(2 (a - i))``.
+On a grid the least-error candidate is therefore the grid value nearest to
+``s*`` and the most-error candidate is the grid end farthest from it, so no
+brute-force search over the grid is needed.
+"""
+import numpy as np
+
+from .core import incision_projection
+
+
+def make_sia_grid(start=0.0, stop=0.5, step=0.1):
+    # Inclusive of stop; rounded so 0.1-style steps give clean 0.3 rather than 0.30000000000000004
+    if step <= 0:
+        raise ValueError("SIA grid step must be positive")
+    if stop < start:
+        raise ValueError("SIA grid stop must not be below start")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return np.round(start + step * np.arange(count), 10)
+
+
+def optimal_sia(actual_mag, actual_axis, incision_axis, sia_min=None, sia_max=None, axis_table=None):
+    # Returns (s*, error at s*), with s* optionally clipped to [sia_min, sia_max]
+    along, across = incision_projection(actual_mag, actual_axis, incision_axis, axis_table)
+    sia = along
+    if sia_min is not None or sia_max is not None:
+        sia = np.clip(along, sia_min, sia_max)
+    return sia, np.hypot(along - sia, across)
+
+
+def grid_extremes(actual_mag, actual_axis, incision_axis, sia_values, axis_table=None):
+    # Returns (least-error SIA, least error, most-error SIA, most error) per row
+    grid = np.sort(np.asarray(sia_values, dtype=float))
+    along, across = incision_projection(actual_mag, actual_axis, incision_axis, axis_table)
+
+    idx = np.searchsorted(grid, along)
+    lower = grid[np.clip(idx - 1, 0, len(grid) - 1)]
+    upper = grid[np.clip(idx, 0, len(grid) - 1)]
+    least = np.where(np.abs(along - lower) <= np.abs(upper - along), lower, upper)
+    most = np.where(np.abs(along - grid[0]) >= np.abs(grid[-1] - along), grid[0], grid[-1])
+    return least, np.hypot(along - least, across), most, np.hypot(along - most, across)
@@ -0,0 +1,90 @@
+"""Incremental batch recomputation for growing registries.
+
+Computed result columns are remembered per row fingerprint, a 64-bit hash of
+(INCISION LOCATION, ACTUAL SIA MAGNITUDE, ACTUAL SIA AXIS) mixed with the
+SIA grid and output options. On the next run only rows whose fingerprint has
+not been seen are computed; everything else is taken from the store.
+"""
+import os
+import threading
+
+import numpy as np
+
+from .batch import (DEFAULT_SIA_VALUES, REQUIRED_COLS, attach_columns, compute_sia_errors,
+                    result_column_names)
+from .validate import validate_inputs
+
+FINGERPRINT_COL = "FINGERPRINT"
+DEFAULT_MAX_ROWS = 5_000_000
+
+
+def row_fingerprints(df, sia_values, *options):
+    from pandas.util import hash_array, hash_pandas_object
+
+    rows = hash_pandas_object(df[REQUIRED_COLS], index=False).to_numpy()
+    config = repr((tuple(float(v) for v in sia_values),) + options)
+    return rows ^ hash_array(np.array([config], dtype=object))[0]
+
+
+class IncrementalStore:
+    # Fingerprint-indexed result rows; the oldest rows are dropped beyond max_rows
+
+    def __init__(self, max_rows=DEFAULT_MAX_ROWS):
+        import pandas as pd
+
+        self.max_rows = max_rows
+        self.results = pd.DataFrame(index=pd.Index([], dtype="uint64", name=FINGERPRINT_COL))
+        self._lock = threading.Lock()
+
+    def compute(self, df, sia_values=DEFAULT_SIA_VALUES, decimals=3, include_optimum=False, include_vectors=False):
+        # Returns (result df, validation report, {"rows", "reused", "computed"})
+        import pandas as pd
+
+        df, invalid, report = validate_inputs(df)
+        fingerprints = row_fingerprints(df, sia_values, decimals, include_optimum, include_vectors)
+        names = result_column_names(sia_values, include_optimum, include_vectors)
+        values = np.empty((len(df), len(names)))
+
+        with self._lock:
+            positions = self.results.index.get_indexer(fingerprints)
+            fresh = positions < 0
+            if not fresh.all():
+                # Gather the reused rows first instead of copying the whole store
+                columns = self.results.columns.get_indexer(names)
+                values[~fresh] = self.results.iloc[positions[~fresh], columns].to_numpy()
+
+        if fresh.any():
+            computed = compute_sia_errors(df.loc[fresh, REQUIRED_COLS], sia_values, decimals,
+                                          include_optimum, skip=invalid[fresh], include_vectors=include_vectors)
+            values[fresh] = computed[names].to_numpy()
+            added = pd.DataFrame(values[fresh], columns=names,
+                                 index=pd.Index(fingerprints[fresh], name=FINGERPRINT_COL))
+            self._add(added[~added.index.duplicated()])
+
+        stats = {"rows": len(df), "reused": int((~fresh).sum()), "computed": int(fresh.sum())}
+        return attach_columns(df, dict(zip(names, values.T))), report, stats
+
+    def _add(self, added):
+        import pandas as pd
+
+        with self._lock:
+            added = added[~added.index.isin(self.results.index)]
+            self.results = added if self.results.empty else pd.concat([self.results, added])
+            if len(self.results) > self.max_rows:
+                self.results = self.results.iloc[-self.max_rows:]
+
+    def __len__(self):
+        return len(self.results)
+
+    def save(self, path):
+        with self._lock:
+            self.results.to_parquet(path)
+
+    @classmethod
+    def load(cls, path, max_rows=DEFAULT_MAX_ROWS):
+        import pandas as pd
+
+        store = cls(max_rows)
+        if os.path.exists(path):
+            store.results = pd.read_parquet(path)
+        return store
@@ -0,0 +1,98 @@
+"""Per-stage timing, throughput and memory instrumentation, plus opt-in profiling.
+
+RunTimer records wall time, row counts and the process peak RSS for named
+stages such as parse, compute, render and export. Repeated stages, e.g. one
+per streamed chunk, accumulate. Results export as JSON.
+
+track_memory=True also records the tracemalloc peak of Python/NumPy
+allocations per stage. Tracing slows allocation-heavy stages several-fold and
+is process-global, so it is a separate opt-in for single-process runs and is
+never turned on by the Streamlit app, where sessions share the process.
+profile_call runs a callable under cProfile and returns a .prof dump that
+opens in pstats or snakeviz.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+def max_rss_bytes():
+    # Peak resident set size of this process, where the platform reports it
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if os.uname().sysname == "Darwin" else rss * 1024
+
+
+class RunTimer:
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        # Yields a dict; set info["rows"] inside the block when the count is only known afterwards
+        info = {"rows": rows}
+        owns_tracing = False
+        if self.track_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                owns_tracing = True
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if self.track_memory else None
+            if owns_tracing:
+                tracemalloc.stop()
+            record = self.stages.setdefault(name, {"seconds": 0.0, "rows": 0, "calls": 0, "max_rss_bytes": None,
+                                                   "peak_bytes": None})
+            record["seconds"] += seconds
+            record["max_rss_bytes"] = max_rss_bytes()
+            record["rows"] += info["rows"] or 0
+            record["calls"] += 1
+            if peak is not None:
+                record["peak_bytes"] = max(record["peak_bytes"] or 0, peak)
+
+    def summary(self):
+        stages = []
+        for name, record in self.stages.items():
+            rows_per_s = record["rows"] / record["seconds"] if record["rows"] and record["seconds"] else None
+            stages.append(dict(stage=name, **record, rows_per_s=rows_per_s))
+        return {
+            "stages": stages,
+            "total_seconds": sum(r["seconds"] for r in self.stages.values()),
+            "max_rss_bytes": max_rss_bytes(),
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.summary(), **kwargs)
+
+
+def profile_call(fn, *args, **kwargs):
+    # Returns (fn result, .prof bytes, top-25 cumulative text report)
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn, *args, **kwargs)
+    fd, path = tempfile.mkstemp(suffix=".prof")
+    os.close(fd)
+    try:
+        profiler.dump_stats(path)
+        with open(path, "rb") as f:
+            dump = f.read()
+    finally:
+        os.remove(path)
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(25)
+    return result, dump, report.getvalue()
@@ -0,0 +1,173 @@
+"""Background job queue for multi-file, multi-sheet batch uploads.
+
+Every sheet of every uploaded workbook becomes one job. Jobs run on a worker
+pool, a thread pool by default or a process pool with executor="process", so
+the Streamlit script thread only polls their status. Finished jobs can be
+bundled into one zip (one file per sheet) or one combined workbook (one sheet
+per job).
+"""
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .batch import DEFAULT_SIA_VALUES, REQUIRED_COLS, compute_sia_errors, missing_columns
+from .fileio import EXPORT_FORMATS, excel_sheet_names, export_bytes, read_batch_excel, to_xlsx_sheets_bytes, zip_bytes
+from .validate import validate_inputs
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+def run_sheet(data, sheet_name, sia_values=DEFAULT_SIA_VALUES, include_optimum=False, required_only=True,
+              include_vectors=False, layout="wide"):
+    # Returns (result df, validation report) for one sheet; raises ValueError when required columns are missing
+    df = read_batch_excel(data, required_only=required_only, sheet_name=sheet_name)
+    missing = missing_columns(df)
+    if missing:
+        raise ValueError(f"sheet must contain columns: {REQUIRED_COLS} (missing {missing})")
+    df, invalid, report = validate_inputs(df)
+    return compute_sia_errors(df, sia_values, include_optimum=include_optimum, skip=invalid,
+                              include_vectors=include_vectors, layout=layout), report
+
+
+class Job:
+    def __init__(self, job_id, file_name, sheet_name):
+        self.id = job_id
+        self.file_name = file_name
+        self.sheet_name = sheet_name
+        self.status = QUEUED
+        self.error = None
+        self.result = None
+        self.report = None
+        self.submitted = time.monotonic()
+        self.started = None
+        self.finished = None
+
+    @property
+    def label(self):
+        return f"{os.path.splitext(self.file_name)[0]} - {self.sheet_name}"
+
+    @property
+    def seconds(self):
+        if self.started is None:
+            return None
+        return (self.finished or time.monotonic()) - self.started
+
+    def as_row(self):
+        return {
+            "FILE": self.file_name,
+            "SHEET": self.sheet_name,
+            "STATUS": self.status,
+            "ROWS": None if self.report is None else self.report["rows"],
+            "INVALID ROWS": None if self.report is None else self.report["invalid"],
+            "SECONDS": None if self.seconds is None else round(self.seconds, 3),
+            "ERROR": self.error or "",
+        }
+
+
+class JobQueue:
+    # Thread-safe; submit() returns immediately and jobs update as the pool works through them
+
+    def __init__(self, workers=None, executor="thread"):
+        workers = workers or min(4, os.cpu_count() or 1)
+        if executor == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sia-job")
+        elif executor == "process":
+            self._pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            raise ValueError(f"Unsupported executor '{executor}', expected 'thread' or 'process'")
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self.jobs = []
+
+    def submit_workbook(self, file_name, data, sia_values=DEFAULT_SIA_VALUES, include_optimum=False,
+                        required_only=True, sheets=None, include_vectors=False, layout="wide"):
+        # One job per sheet (all sheets unless sheets is given); returns the new jobs
+        try:
+            sheets = sheets or excel_sheet_names(data)
+        except Exception as exc:
+            sheets, error = ["?"], f"could not open workbook: {exc}"
+        else:
+            error = None
+        new_jobs = []
+        with self._lock:
+            for sheet_name in sheets:
+                job = Job(next(self._ids), file_name, sheet_name)
+                self.jobs.append(job)
+                new_jobs.append(job)
+        for job in new_jobs:
+            if error:
+                job.status, job.error, job.finished = FAILED, error, time.monotonic()
+                continue
+            args = (data, job.sheet_name, sia_values, include_optimum, required_only, include_vectors, layout)
+            if isinstance(self._pool, ThreadPoolExecutor):
+                future = self._pool.submit(self._run, job, *args)
+            else:
+                # Worker processes can't update the job, so its time includes the wait in the queue
+                job.status, job.started = RUNNING, job.submitted
+                future = self._pool.submit(run_sheet, *args)
+            future.add_done_callback(lambda f, job=job: self._finish(job, f))
+        return new_jobs
+
+    @staticmethod
+    def _run(job, *args):
+        job.status, job.started = RUNNING, time.monotonic()
+        return run_sheet(*args)
+
+    def _finish(self, job, future):
+        job.finished = time.monotonic()
+        job.started = job.started or job.submitted
+        try:
+            job.result, job.report = future.result()
+            job.status = DONE
+        except Exception as exc:
+            job.status, job.error = FAILED, str(exc)
+
+    def progress(self):
+        # (finished jobs, total jobs); failed jobs count as finished
+        with self._lock:
+            jobs = list(self.jobs)
+        return sum(job.status in (DONE, FAILED) for job in jobs), len(jobs)
+
+    def busy(self):
+        done, total = self.progress()
+        return done < total
+
+    def status_frame(self):
+        import pandas as pd
+
+        with self._lock:
+            return pd.DataFrame([job.as_row() for job in self.jobs])
+
+    def completed(self):
+        with self._lock:
+            return [job for job in self.jobs if job.status == DONE]
+
+    def clear(self):
+        # Forget finished jobs; running ones keep going and stay listed
+        with self._lock:
+            self.jobs = [job for job in self.jobs if job.status not in (DONE, FAILED)]
+
+    def shutdown(self, wait=False):
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def results_zip(jobs, fmt="xlsx"):
+    # One results file per job, named after its workbook and sheet
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}', expected one of {list(EXPORT_FORMATS)}")
+    names = {}
+    for job in jobs:
+        base = f"{job.label.replace('/', '_')}.{fmt}"
+        name, n = base, 1
+        while name in names:
+            n += 1
+            name = f"{job.label.replace('/', '_')} ({n}).{fmt}"
+        names[name] = export_bytes(job.result, fmt)
+    return zip_bytes(names)
+
+
+def combined_workbook(jobs):
+    # One sheet per job; sheet names are shortened to Excel's 31-character limit
+    return to_xlsx_sheets_bytes([(job.label, job.result) for job in jobs])
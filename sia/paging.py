@@ -0,0 +1,71 @@
+"""Server-side sort, filter and pagination of batch results.
+
+Only the requested page is materialized as a DataFrame, so the front-end
+never has to serialize the full result frame to the browser.
+"""
+import math
+import warnings
+
+import numpy as np
+
+from .batch import column_values
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def filter_mask(df, filters):
+    # filters maps column -> (low, high); either bound may be None. Rows with NaN in a filtered column drop out.
+    mask = np.ones(len(df), dtype=bool)
+    for col, (low, high) in (filters or {}).items():
+        values = column_values(df, col)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        if low is None and high is None:
+            mask &= ~np.isnan(values)
+    return mask
+
+
+def row_order(df, mask, sort_by=None, ascending=True):
+    # Positions of the matching rows in display order; NaNs sort last either way
+    positions = np.flatnonzero(mask)
+    if sort_by is None:
+        return positions
+    if df[sort_by].dtype.kind in "fiub":
+        values = column_values(df, sort_by)[positions]
+        keys = values if ascending else -values
+        order = np.argsort(keys, kind="stable")
+    else:
+        order = np.argsort(df[sort_by].to_numpy()[positions].astype(str), kind="stable")
+        if not ascending:
+            order = order[::-1]
+    return positions[order]
+
+
+def page_slice(df, order, page=1, page_size=DEFAULT_PAGE_SIZE):
+    # Returns (page DataFrame, page number actually shown, page count)
+    n_pages = max(1, math.ceil(len(order) / page_size))
+    page = min(max(1, page), n_pages)
+    start = (page - 1) * page_size
+    return df.iloc[order[start:start + page_size]], page, n_pages
+
+
+def result_summary(df, columns):
+    # Count, mean, SD, min, quartiles and max per column, computed column-wise without copying rows
+    import pandas as pd
+
+    values = (np.column_stack([column_values(df, col) for col in columns]) if columns
+              else np.empty((len(df), 0)))
+    valid = ~np.isnan(values)
+    stats = {"count": valid.sum(axis=0), "missing": (~valid).sum(axis=0)}
+    with warnings.catch_warnings():
+        # All-NaN columns (e.g. every row invalid) just summarize to NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        stats["mean"] = np.nanmean(values, axis=0)
+        stats["std"] = np.nanstd(values, axis=0, ddof=1)
+        quantiles = (np.nanquantile(values, [0.0, 0.25, 0.5, 0.75, 1.0], axis=0) if len(values)
+                     else np.full((5, len(columns)), np.nan))
+    for name, row in zip(("min", "25%", "median", "75%", "max"), quantiles):
+        stats[name] = row
+    return pd.DataFrame(stats, index=columns)
@@ -0,0 +1,100 @@
+"""Process-pool execution of the batch computation.
+
+Rows are split into contiguous shards, each shard is computed in a worker
+process and the results are reassembled in the original row order. For file
+runs the workers also serialize their result chunks, so the parent process
+only parses the input and appends the finished output.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .batch import (DEFAULT_SIA_VALUES, LAYOUTS, attach_columns, blank_rows, input_arrays, long_layout,
+                    result_columns)
+from .core import sia_error_matrix
+from .stream import DEFAULT_CHUNKSIZE, ChunkWriter, encode_chunk, iter_chunks, process_chunk
+from .trig import AXIS_TABLE
+
+DEFAULT_SHARD_ROWS = 250_000
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def _shard_bounds(n_rows, shard_rows):
+    return [(start, min(start + shard_rows, n_rows)) for start in range(0, n_rows, shard_rows)]
+
+
+def _shard_errors(actual_mag, actual_axis, incision_axis, sia_values, decimals, axis_table):
+    errors = sia_error_matrix(actual_mag, actual_axis, incision_axis, sia_values, axis_table)
+    if decimals is not None:
+        errors = np.round(errors, decimals)
+    return errors
+
+
+def sia_error_matrix_parallel(actual_mag, actual_axis, incision_axis, sia_values=DEFAULT_SIA_VALUES,
+                              workers=None, shard_rows=DEFAULT_SHARD_ROWS, decimals=None, axis_table=AXIS_TABLE):
+    actual_mag = np.asarray(actual_mag, dtype=float)
+    actual_axis = np.asarray(actual_axis, dtype=float)
+    incision_axis = np.asarray(incision_axis, dtype=float)
+    workers = workers or default_workers()
+    bounds = _shard_bounds(len(actual_mag), shard_rows)
+    if workers <= 1 or len(bounds) <= 1:
+        return _shard_errors(actual_mag, actual_axis, incision_axis, sia_values, decimals, axis_table)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_shard_errors, actual_mag[a:b], actual_axis[a:b], incision_axis[a:b],
+                               sia_values, decimals, axis_table)
+                   for a, b in bounds]
+        return np.concatenate([f.result() for f in futures], axis=0)
+
+
+def compute_sia_errors_parallel(df, sia_values=DEFAULT_SIA_VALUES, decimals=3, include_optimum=False,
+                                skip=None, workers=None, shard_rows=DEFAULT_SHARD_ROWS, axis_table=AXIS_TABLE,
+                                include_vectors=False, layout="wide"):
+    # Parallel counterpart of batch.compute_sia_errors; same columns, same order
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unsupported layout '{layout}', expected one of {LAYOUTS}")
+    arrays = input_arrays(df)
+    options = (sia_values, decimals, include_optimum, include_vectors, axis_table)
+    workers = workers or default_workers()
+    bounds = _shard_bounds(len(df), shard_rows)
+    if workers <= 1 or len(bounds) <= 1:
+        columns = result_columns(arrays, *options)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(result_columns, tuple(values[a:b] for values in arrays), *options)
+                       for a, b in bounds]
+            shards = [f.result() for f in futures]
+        columns = {name: np.concatenate([shard[name] for shard in shards]) for name in shards[0]}
+    columns = blank_rows(columns, skip)
+    if layout == "long":
+        return long_layout(df, columns, sia_values)
+    return attach_columns(df, columns)
+
+
+def _process_encoded(chunk, fmt, header, *args):
+    return encode_chunk(process_chunk(chunk, *args), fmt, header)
+
+
+def process_file_parallel(input_path, output_path, sia_values=DEFAULT_SIA_VALUES,
+                          chunksize=DEFAULT_CHUNKSIZE, input_format=None, output_format=None,
+                          decimals=3, include_optimum=False, workers=None, include_vectors=False, layout="wide"):
+    # At most 2 * workers chunks are in flight, so memory stays bounded
+    workers = workers or default_workers()
+    rows = 0
+    pending = deque()
+    with ChunkWriter(output_path, output_format) as writer, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in iter_chunks(input_path, chunksize, input_format):
+            pending.append(pool.submit(_process_encoded, chunk, writer.fmt, rows == 0, sia_values, decimals,
+                                       include_optimum, None, include_vectors, layout, rows))
+            rows += len(chunk)
+            if len(pending) >= 2 * workers:
+                writer.write_encoded(pending.popleft().result())
+        while pending:
+            writer.write_encoded(pending.popleft().result())
+    return rows
@@ -0,0 +1,93 @@
+"""Eye diagram rendering for Single Case mode.
+
+The iris/pupil background and reference lines are drawn once per process and
+reused, so each render only swaps the three vector arrows. matplotlib is
+imported on first use. render_vector_svg is a lighter renderer that builds the
+same diagram as an SVG string without matplotlib.
+"""
+import math
+import threading
+from io import BytesIO
+
+from .core import vector_difference_components, double_angle_to_polar
+
+_canvas_lock = threading.Lock()
+_canvas = None
+
+
+def vector_overlay(expected_mag, incision_axis, actual_mag, actual_axis):
+    # (magnitude, axis, color, label, linestyle) for the expected, actual and error arrows
+    error_vec = vector_difference_components(actual_mag, actual_axis, expected_mag, incision_axis)
+    err_mag, err_axis = double_angle_to_polar(error_vec)
+    return [
+        (expected_mag, incision_axis, 'blue', f'Expected ({expected_mag}D @ {incision_axis}°)', '-'),
+        (actual_mag, actual_axis, 'green', f'Actual ({actual_mag}D @ {actual_axis}°)', '-'),
+        (float(err_mag), float(err_axis), 'red', f'Error ({err_mag:.3f}D @ {err_axis:.1f}°)', '--'),
+    ]
+
+
+def _vector_tip(magnitude, axis_deg):
+    axis_rad = math.radians(axis_deg)
+    return magnitude * math.cos(axis_rad), magnitude * math.sin(axis_rad)
+
+
+def _eye_canvas():
+    global _canvas
+    if _canvas is None:
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Circle
+
+        fig = Figure(figsize=(6, 6))
+        ax = fig.subplots()
+        ax.add_artist(Circle((0, 0), 1.0, fill=True, color=(0.6, 0.4, 0.2, 0.3), ec='black', lw=2))
+        ax.add_artist(Circle((0, 0), 0.85, fill=True, color=(1, 1, 0, 0.2), ec='black', lw=1))
+        ax.plot([-1, 1], [0, 0], linestyle=':', color='gray')
+        ax.plot([0, 0], [-1, 1], linestyle=':', color='gray')
+        ax.set_xlim(-1, 1)
+        ax.set_ylim(-1, 1)
+        ax.set_aspect('equal', adjustable='box')
+        ax.axis('off')
+        _canvas = (fig, ax, [])
+    return _canvas
+
+
+def render_vector_png(expected_mag, incision_axis, actual_mag, actual_axis):
+    with _canvas_lock:
+        fig, ax, overlay = _eye_canvas()
+        for artist in overlay:
+            artist.remove()
+        overlay.clear()
+        for magnitude, axis_deg, color, label, style in vector_overlay(expected_mag, incision_axis,
+                                                                       actual_mag, actual_axis):
+            x, y = _vector_tip(magnitude, axis_deg)
+            overlay.append(ax.arrow(0, 0, x, y, head_width=0.05, head_length=0.1, fc=color, ec=color,
+                                    linestyle=style, linewidth=2, label=label))
+        ax.legend(loc='upper right')
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+_SVG_BACKGROUND = (
+    "<circle cx='0' cy='0' r='1' fill='rgb(153,102,51)' fill-opacity='0.3' stroke='black' stroke-width='0.02'/>"
+    "<circle cx='0' cy='0' r='0.85' fill='yellow' fill-opacity='0.2' stroke='black' stroke-width='0.01'/>"
+    "<line x1='-1' y1='0' x2='1' y2='0' stroke='gray' stroke-width='0.008' stroke-dasharray='0.01 0.02'/>"
+    "<line x1='0' y1='-1' x2='0' y2='1' stroke='gray' stroke-width='0.008' stroke-dasharray='0.01 0.02'/>"
+)
+
+
+def render_vector_svg(expected_mag, incision_axis, actual_mag, actual_axis, size=450):
+    arrows, legend = [], []
+    for i, (magnitude, axis_deg, color, label, style) in enumerate(
+            vector_overlay(expected_mag, incision_axis, actual_mag, actual_axis)):
+        x, y = _vector_tip(magnitude, axis_deg)
+        dash = " stroke-dasharray='0.04 0.03'" if style == '--' else ""
+        arrows.append(f"<line x1='0' y1='0' x2='{x:.4f}' y2='{-y:.4f}' stroke='{color}' stroke-width='0.02'"
+                      f"{dash} marker-end='url(#head-{color})'/>")
+        legend.append(f"<text x='0.35' y='{-0.92 + 0.08 * i:.2f}' font-size='0.06' fill='{color}'>{label}</text>")
+    markers = "".join(
+        f"<marker id='head-{c}' viewBox='0 0 10 10' refX='8' refY='5' markerWidth='4' markerHeight='4' "
+        f"orient='auto'><path d='M0,0 L10,5 L0,10 z' fill='{c}'/></marker>"
+        for c in ('blue', 'green', 'red'))
+    return (f"<svg xmlns='http://www.w3.org/2000/svg' width='{size}' height='{size}' viewBox='-1.05 -1.05 2.1 2.1'>"
+            f"<defs>{markers}</defs>{_SVG_BACKGROUND}{''.join(arrows)}{''.join(legend)}</svg>")
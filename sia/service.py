@@ -0,0 +1,277 @@
+"""Async HTTP service exposing the SIA error engine.
+
+    python -m sia.service --port 8080
+
+Endpoints:
+
+    POST /v1/error    one case as JSON; concurrent requests are micro-batched
+                      into a single vectorized call
+    POST /v1/batch    many rows as JSON ({"rows": [...]}) or a CSV body;
+                      returns JSON records, or CSV when Accept is text/csv
+    GET  /metrics     request counts, latency percentiles, throughput and
+                      micro-batch sizes
+    GET  /health
+
+Requires aiohttp.
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from io import BytesIO
+
+import numpy as np
+
+from .batch import DEFAULT_SIA_VALUES, REQUIRED_COLS, compute_sia_errors, missing_columns
+from .core import double_angle_to_polar, sia_error_matrix, vector_difference_components
+from .validate import validate_inputs
+
+DEFAULT_MAX_BATCH = 1024
+DEFAULT_MAX_DELAY = 0.002
+LATENCY_WINDOW = 10_000
+# Requests that match no route (404/405) are counted together, so scanned paths can't grow /metrics
+UNMATCHED_ROUTE = "(unmatched)"
+
+
+class Metrics:
+    # Rolling request latencies plus lifetime counters
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = {}
+        self.errors = 0
+        self.rows = 0
+        self.batches = 0
+        self.batched_cases = 0
+        self.max_batch_size = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def record_request(self, route, seconds, ok):
+        self.requests[route] = self.requests.get(route, 0) + 1
+        if not ok:
+            self.errors += 1
+        self._latencies.append((time.monotonic(), seconds))
+
+    def record_batch(self, size):
+        self.batches += 1
+        self.batched_cases += size
+        self.max_batch_size = max(self.max_batch_size, size)
+
+    def snapshot(self):
+        now = time.monotonic()
+        latencies = np.array([s for _, s in self._latencies]) * 1000
+        recent = sum(1 for t, _ in self._latencies if now - t <= 10.0)
+        percentiles = (dict(zip(("p50", "p95", "p99"), np.percentile(latencies, [50, 95, 99]).round(3)))
+                       if len(latencies) else {})
+        return {
+            "uptime_s": round(now - self.started, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "rows_computed": self.rows,
+            "latency_ms": {k: float(v) for k, v in percentiles.items()},
+            "requests_per_s_10s": round(recent / min(10.0, max(now - self.started, 1e-9)), 3),
+            "micro_batches": self.batches,
+            "mean_micro_batch": round(self.batched_cases / self.batches, 3) if self.batches else 0.0,
+            "max_micro_batch": self.max_batch_size,
+        }
+
+
+def parse_case(payload):
+    # Single-case JSON body -> (incision_axis, actual_mag, actual_axis, expected_mag, sia_values)
+    try:
+        case = [float(payload[key]) for key in ("incision_axis", "actual_mag", "actual_axis")]
+        expected_mag = float(payload.get("expected_mag", 0.0))
+        sia_values = tuple(float(v) for v in payload.get("sia_values", DEFAULT_SIA_VALUES))
+    except KeyError as exc:
+        raise ValueError(f"missing field {exc.args[0]!r}")
+    except (TypeError, ValueError):
+        raise ValueError("fields must be numbers")
+    if not all(math.isfinite(v) for v in case + [expected_mag, *sia_values]):
+        raise ValueError("fields must be finite")
+    if case[1] < 0 or expected_mag < 0:
+        raise ValueError("magnitudes must not be negative")
+    if not sia_values:
+        raise ValueError("sia_values must not be empty")
+    incision_axis, actual_mag, actual_axis = case
+    return incision_axis % 180, actual_mag, actual_axis % 180, expected_mag, sia_values
+
+
+class MicroBatcher:
+    # Collects single cases for up to max_delay seconds and computes them in one vectorized pass
+
+    def __init__(self, metrics, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY):
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, case):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((case, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            items = [await self._queue.get()]
+            if self.max_delay:
+                await asyncio.sleep(self.max_delay)
+            while len(items) < self.max_batch and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            self.metrics.record_batch(len(items))
+            groups = {}
+            for case, future in items:
+                groups.setdefault(case[4], []).append((case, future))
+            for sia_values, group in groups.items():
+                try:
+                    results = compute_cases([case for case, _ in group], sia_values)
+                except Exception as exc:
+                    for _, future in group:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+                for (_, future), result in zip(group, results):
+                    if not future.done():
+                        future.set_result(result)
+            self.metrics.rows += len(items)
+
+
+def compute_cases(cases, sia_values):
+    incision_axis, actual_mag, actual_axis, expected_mag = np.array([case[:4] for case in cases], dtype=float).T
+    errors = sia_error_matrix(actual_mag, actual_axis, incision_axis, sia_values)
+    err_mag, err_axis = double_angle_to_polar(
+        vector_difference_components(actual_mag, actual_axis, expected_mag, incision_axis))
+    sia = np.asarray(sia_values)
+    least, most = sia[errors.argmin(axis=1)], sia[errors.argmax(axis=1)]
+    return [{
+        "sia_values": list(sia_values),
+        "errors": errors[i].tolist(),
+        "least_sia": float(least[i]),
+        "most_sia": float(most[i]),
+        "error_vector": {"magnitude": float(err_mag[i]), "axis": float(err_axis[i])},
+    } for i in range(len(cases))]
+
+
+def compute_bulk(df, sia_values, include_optimum):
+    missing = missing_columns(df)
+    if missing:
+        raise ValueError(f"input must contain columns: {REQUIRED_COLS} (missing {missing})")
+    df, invalid, report = validate_inputs(df)
+    return compute_sia_errors(df, sia_values, include_optimum=include_optimum, skip=invalid), report
+
+
+def run_bulk(body, content_type, query, accept):
+    # Parse, compute and encode one /v1/batch request; runs in an executor so large bodies don't block the
+    # event loop. Returns (response text, content type, rows computed).
+    import pandas as pd
+
+    if content_type == "text/csv":
+        df = pd.read_csv(BytesIO(body))
+        sia_values = [float(v) for v in query.get("sia_values", "").split(",") if v] or DEFAULT_SIA_VALUES
+        include_optimum = query.get("include_optimum", "") in ("1", "true")
+    else:
+        payload = json.loads(body)
+        df = pd.DataFrame(payload["rows"])
+        sia_values = [float(v) for v in payload.get("sia_values", DEFAULT_SIA_VALUES)]
+        include_optimum = bool(payload.get("include_optimum", False))
+    result, report = compute_bulk(df, sia_values, include_optimum)
+    if "text/csv" in accept:
+        return result.to_csv(index=False), "text/csv", len(result)
+    return (f'{{"report":{json.dumps(report)},"rows":{result.to_json(orient="records")}}}', "application/json",
+            len(result))
+
+
+def route_label(request):
+    # The matched route's path template, or UNMATCHED_ROUTE
+    resource = request.match_info.route.resource
+    return UNMATCHED_ROUTE if resource is None else resource.canonical
+
+
+def create_app(max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY):
+    from aiohttp import web
+
+    metrics = Metrics()
+    batcher = MicroBatcher(metrics, max_batch, max_delay)
+
+    @web.middleware
+    async def timing(request, handler):
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = await handler(request)
+            ok = response.status < 400
+            return response
+        finally:
+            metrics.record_request(route_label(request), time.perf_counter() - start, ok)
+
+    async def error(request):
+        try:
+            case = parse_case(await request.json())
+        except ValueError as exc:
+            return web.json_response({"error": str(exc)}, status=400)
+        return web.json_response(await batcher.submit(case))
+
+    async def batch(request):
+        body = await request.read()
+        loop = asyncio.get_running_loop()
+        try:
+            text, content_type, rows = await loop.run_in_executor(
+                None, run_bulk, body, request.content_type, dict(request.query), request.headers.get("Accept", ""))
+        except (ValueError, KeyError, TypeError) as exc:
+            return web.json_response({"error": str(exc)}, status=400)
+        metrics.rows += rows
+        return web.Response(text=text, content_type=content_type)
+
+    async def metrics_view(request):
+        return web.json_response(metrics.snapshot())
+
+    async def health(request):
+        return web.json_response({"status": "ok"})
+
+    async def on_startup(app):
+        batcher.start()
+
+    async def on_cleanup(app):
+        await batcher.stop()
+
+    app = web.Application(middlewares=[timing], client_max_size=256 * 1024 * 1024)
+    app.add_routes([
+        web.post("/v1/error", error),
+        web.post("/v1/batch", batch),
+        web.get("/metrics", metrics_view),
+        web.get("/health", health),
+    ])
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+
+def main(argv=None):
+    from aiohttp import web
+
+    parser = argparse.ArgumentParser(prog="python -m sia.service", description="Serve the SIA error engine over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help=f"most single cases per vectorized call (default: {DEFAULT_MAX_BATCH})")
+    parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help=f"how long to gather single cases before computing (default: {DEFAULT_MAX_DELAY * 1000:g})")
+    args = parser.parse_args(argv)
+    web.run_app(create_app(args.max_batch, args.max_delay_ms / 1000), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
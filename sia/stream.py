@@ -0,0 +1,144 @@
+"""Chunked CSV/Parquet reading and writing for headless batch runs.
+
+Input is read and output is written one fixed-size chunk at a time, so memory
+use depends on the chunk size and not on the size of the file.
+"""
+import os
+
+from .batch import REQUIRED_COLS, DEFAULT_SIA_VALUES, missing_columns, compute_sia_errors, wide_to_long
+from .instrument import RunTimer
+from .validate import validate_inputs
+
+DEFAULT_CHUNKSIZE = 100_000
+FORMATS = ("csv", "parquet")
+
+
+def detect_format(path):
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Cannot infer file format from '{path}', expected one of {FORMATS}")
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE, fmt=None):
+    import pandas as pd
+
+    fmt = fmt or detect_format(path)
+    if fmt == "csv":
+        # Pass-through columns are kept as text so their type can't change from one chunk to the next
+        header = pd.read_csv(path, nrows=0).columns
+        dtype = {col: str for col in header if col not in REQUIRED_COLS}
+        with pd.read_csv(path, chunksize=chunksize, dtype=dtype) as reader:
+            yield from reader
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"Unsupported format '{fmt}', expected one of {FORMATS}")
+
+
+def encode_chunk(df, fmt, header=True):
+    # Serialized result chunk for ChunkWriter.write_encoded: CSV text, or an Arrow table for Parquet.
+    # process_file_parallel runs this in the workers so the parent only appends.
+    if fmt == "csv":
+        return df.to_csv(index=False, header=header)
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+class ChunkWriter:
+    # Appends DataFrame chunks to a single CSV or Parquet file. The Parquet schema is fixed by the first
+    # chunk, with all-blank columns stored as strings, and later chunks are cast to it. If the run fails,
+    # the partial output file is removed.
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt or detect_format(path)
+        if self.fmt not in FORMATS:
+            raise ValueError(f"Unsupported format '{self.fmt}', expected one of {FORMATS}")
+        self._csv_file = None
+        self._parquet_writer = None
+        self._schema = None
+
+    @property
+    def started(self):
+        return self._csv_file is not None or self._parquet_writer is not None
+
+    def write(self, df):
+        self.write_encoded(encode_chunk(df, self.fmt, header=not self.started))
+
+    def write_encoded(self, data):
+        # data comes from encode_chunk; CSV text must carry the header only for the first chunk
+        if self.fmt == "csv":
+            if self._csv_file is None:
+                self._csv_file = open(self.path, "w", newline="", encoding="utf-8")
+            self._csv_file.write(data)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._parquet_writer is None:
+                self._schema = pa.schema([field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                                          for field in data.schema.remove_metadata()])
+                self._parquet_writer = pq.ParquetWriter(self.path, self._schema)
+            self._parquet_writer.write_table(data.cast(self._schema))
+
+    def close(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def process_chunk(df, sia_values=DEFAULT_SIA_VALUES, decimals=3, include_optimum=False, store=None,
+                  include_vectors=False, layout="wide", row_offset=0):
+    # row_offset is the chunk's first row in the whole input, used for ROW in the long layout
+    missing = missing_columns(df)
+    if missing:
+        raise ValueError(f"Input must contain columns: {REQUIRED_COLS} (missing {missing})")
+    if store is not None:
+        result = store.compute(df, sia_values, decimals, include_optimum, include_vectors)[0]
+        return wide_to_long(result, sia_values, row_offset) if layout == "long" else result
+    df, invalid, _ = validate_inputs(df)
+    return compute_sia_errors(df, sia_values, decimals, include_optimum, skip=invalid,
+                              include_vectors=include_vectors, layout=layout, row_offset=row_offset)
+
+
+def process_file(input_path, output_path, sia_values=DEFAULT_SIA_VALUES,
+                 chunksize=DEFAULT_CHUNKSIZE, input_format=None, output_format=None, decimals=3,
+                 include_optimum=False, store=None, timer=None, include_vectors=False, layout="wide"):
+    # store is an optional incremental.IncrementalStore that skips rows computed in earlier runs;
+    # timer is an optional instrument.RunTimer that receives read/compute/write stage timings
+    timer = timer or RunTimer()
+    rows = 0
+    chunks = iter_chunks(input_path, chunksize, input_format)
+    with ChunkWriter(output_path, output_format) as writer:
+        while True:
+            with timer.stage("read") as info:
+                chunk = next(chunks, None)
+                info["rows"] = 0 if chunk is None else len(chunk)
+            if chunk is None:
+                break
+            with timer.stage("compute", len(chunk)):
+                result = process_chunk(chunk, sia_values, decimals, include_optimum, store, include_vectors, layout,
+                                       rows)
+            with timer.stage("write", len(chunk)):
+                writer.write(result)
+            rows += len(chunk)
+    return rows
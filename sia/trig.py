@@ -0,0 +1,59 @@
+"""Precomputed cos/sin tables for the double-angle conversion of quantized axes.
+
+Axes in clinical data are almost always whole or half degrees. For an axis
+``a`` that is a multiple of ``1 / divisions`` degree, ``cos(2a)`` and
+``sin(2a)`` are read from a table of ``180 * divisions`` entries instead of
+being evaluated. Every other value, including NaN and inf, falls back to
+``np.cos``/``np.sin``, so any input is accepted.
+
+Accuracy: table entries are computed with the same ``np.radians``/``np.cos``/
+``np.sin`` calls as the direct path, for the axis reduced mod 180. On-grid axes
+in [0, 180) therefore give bit-identical results. Axes outside that range
+differ by the rounding of evaluating trig at 2a rather than at 2a mod 360,
+under 2e-15 for |a| < 720 degrees (the table value is the more accurate one).
+Off-grid axes are computed directly and are bit-identical. Only exact grid
+multiples are looked up, with no snapping of nearby values.
+"""
+import numpy as np
+
+DEFAULT_DIVISIONS = 2
+
+
+def direct_cos_sin(axis_deg):
+    # (cos 2a, sin 2a) by direct evaluation; the reference path for AxisTable
+    axis_rad = np.radians(2 * np.asarray(axis_deg, dtype=float))
+    return np.cos(axis_rad), np.sin(axis_rad)
+
+
+class AxisTable:
+    # cos/sin of the doubled axis for every multiple of 1/divisions degree in [0, 180)
+
+    def __init__(self, divisions=DEFAULT_DIVISIONS):
+        if int(divisions) != divisions or divisions < 1:
+            raise ValueError("AxisTable divisions must be a positive integer")
+        self.divisions = int(divisions)
+        self.size = 180 * self.divisions
+        self.cos, self.sin = direct_cos_sin(np.arange(self.size) / self.divisions)
+
+    def __repr__(self):
+        return f"AxisTable(divisions={self.divisions})"
+
+    def cos_sin(self, axis_deg):
+        axis = np.asarray(axis_deg, dtype=float)
+        scaled = axis * self.divisions
+        with np.errstate(invalid="ignore"):
+            index = scaled.astype(np.int64)
+        on_grid = index == scaled
+        if on_grid.all():
+            index = index % self.size
+            return self.cos[index], self.sin[index]
+        if not on_grid.any():
+            return direct_cos_sin(axis)
+        cos, sin = np.empty_like(axis), np.empty_like(axis)
+        index = index[on_grid] % self.size
+        cos[on_grid], sin[on_grid] = self.cos[index], self.sin[index]
+        cos[~on_grid], sin[~on_grid] = direct_cos_sin(axis[~on_grid])
+        return cos, sin
+
+
+AXIS_TABLE = AxisTable()
@@ -0,0 +1,23 @@
+"""Streamlit modes served by app.py.
+
+MODES maps each sidebar label to the module that renders it. Mode modules are
+imported only when selected, so pandas, openpyxl, xlsxwriter, pyarrow and
+matplotlib load only for the modes that use them.
+"""
+import importlib
+
+MODES = {
+    "Single Case": "sia.ui.single_case",
+    "Batch Processing": "sia.ui.batch_mode",
+    "Batch Jobs (multiple files/sheets)": "sia.ui.batch_jobs",
+    "Single Case (RE/LE orientation)": "sia.ui.eye_orientation",
+    "Single Case (copy box)": "sia.ui.copy_box",
+}
+
+
+def load_mode(label):
+    return importlib.import_module(MODES[label])
+
+
+def render_mode(label):
+    load_mode(label).render()
@@ -0,0 +1,71 @@
+"""Batch Jobs mode: several workbooks, every sheet, computed in the background with live progress."""
+import streamlit as st
+
+from ..batch import LAYOUTS
+from ..fileio import EXPORT_FORMATS, XLSX_MIME
+from ..jobs import JobQueue, combined_workbook, results_zip
+from .common import sia_grid_sidebar
+
+
+def job_queue():
+    # One queue per browser session, so users only see their own jobs
+    if "job_queue" not in st.session_state:
+        st.session_state["job_queue"] = JobQueue()
+    return st.session_state["job_queue"]
+
+
+def cached_bundle(name, build, jobs, *args):
+    # The fragment reruns every second; bundles are only rebuilt when the finished jobs or options change
+    key = (tuple(job.id for job in jobs),) + args
+    cached = st.session_state.get(name)
+    if cached is None or cached[0] != key:
+        cached = (key, build(jobs, *args))
+        st.session_state[name] = cached
+    return cached[1]
+
+
+@st.fragment(run_every=1.0)
+def job_progress(queue, download_format):
+    done, total = queue.progress()
+    if not total:
+        st.caption("No jobs yet.")
+        return
+    st.progress(done / total, text=f"{done} of {total} sheets finished")
+    st.dataframe(queue.status_frame(), hide_index=True)
+
+    completed = queue.completed()
+    if queue.busy() or not completed:
+        return
+    download_cols = st.columns(2)
+    download_cols[0].download_button(f"Download all as zip ({download_format})",
+                                     data=cached_bundle("job_results_zip", results_zip, completed, download_format),
+                                     file_name="SIA_Errors.zip", mime="application/zip")
+    download_cols[1].download_button("Download combined workbook (one sheet each)",
+                                     data=cached_bundle("job_combined_workbook", combined_workbook, completed),
+                                     file_name="SIA_Errors_Combined.xlsx", mime=XLSX_MIME)
+
+
+def render():
+    sia_values, _ = sia_grid_sidebar()
+    st.title("SIA Error Calculator (Batch Jobs)")
+    st.caption("Upload one or more workbooks; every sheet is processed as a separate job in the background.")
+
+    uploaded_files = st.file_uploader("Upload Excel files", type=["xlsx"], accept_multiple_files=True)
+    include_optimum = st.checkbox("Add exact error-minimizing SIA columns")
+    keep_all_columns = st.checkbox("Keep all uploaded columns (slower to read)")
+    include_vectors = st.checkbox("Add error-vector columns (double-angle X/Y, error axis, WTR/ATR)")
+    layout = st.radio("Layout", LAYOUTS, horizontal=True,
+                      format_func={"wide": "Wide (one row per eye)", "long": "Long (one row per eye and candidate SIA)"}.get)
+    download_format = st.radio("Zip file format", list(EXPORT_FORMATS), horizontal=True)
+
+    queue = job_queue()
+    action_cols = st.columns(2)
+    if action_cols[0].button("Start jobs", disabled=not uploaded_files):
+        for uploaded_file in uploaded_files:
+            queue.submit_workbook(uploaded_file.name, uploaded_file.getvalue(), sia_values,
+                                  include_optimum, not keep_all_columns, include_vectors=include_vectors,
+                                  layout=layout)
+    if action_cols[1].button("Clear finished jobs"):
+        queue.clear()
+
+    job_progress(queue, download_format)
@@ -0,0 +1,242 @@
+"""Batch Processing mode: Excel upload, paged results, downloads and cohort analytics."""
+from io import BytesIO
+
+import streamlit as st
+import pandas as pd
+
+from ..batch import LAYOUTS, REQUIRED_COLS, missing_columns, wide_to_long
+from ..cache import ResultCache, upload_cache_key
+from ..fileio import read_batch_excel, export_bytes, EXPORT_FORMATS, XLSX_MIME
+from ..validate import validate_inputs, VALIDATION_COL
+from ..analytics import cohort_summary, double_angle_scatter
+from ..uncertainty import bootstrap_cohort, simulate_measurement_noise
+from ..incremental import IncrementalStore
+from ..instrument import RunTimer, profile_call
+from ..paging import filter_mask, row_order, page_slice, result_summary
+from ..compact import compute_sia_errors_compact, decode_frame, RESULT_DTYPES
+from .common import sia_grid_sidebar
+
+
+@st.cache_resource
+def upload_cache():
+    # Shared across sessions; holds (result DataFrame, {format: export bytes}) per upload + grid
+    return ResultCache(max_bytes=256 * 1024 * 1024)
+
+
+@st.cache_resource
+def incremental_store():
+    # Rows computed in earlier uploads, keyed by input + grid fingerprint
+    return IncrementalStore()
+
+
+@st.cache_data
+def template_xlsx():
+    template_df = pd.DataFrame({
+        "INCISION LOCATION": [],
+        "ACTUAL SIA MAGNITUDE": [],
+        "ACTUAL SIA AXIS": []
+    })
+    return export_bytes(template_df, "xlsx")
+
+
+def batch_cache_key(data, sia_values, include_optimum, required_only, incremental, result_dtype, include_vectors):
+    # The incremental path always stores float64, so result_dtype is left out of its key
+    return upload_cache_key(data, sia_values, include_optimum, required_only, incremental,
+                            None if incremental else result_dtype, include_vectors)
+
+
+@st.cache_data(max_entries=32)
+def cached_cohort_summary(key, group_by, sia_values, _df):
+    # _df is identified by the upload key instead of being hashed on every rerun
+    return cohort_summary(_df, list(group_by), sia_values)
+
+
+@st.cache_data(max_entries=16)
+def cached_scatter_png(key, _df):
+    buffer = BytesIO()
+    double_angle_scatter(_df).savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=16)
+def cached_bootstrap(key, sia_values, n_resamples, seed, _df):
+    return bootstrap_cohort(_df, sia_values, n_resamples, seed=seed)
+
+
+@st.cache_data(max_entries=16)
+def cached_noise_simulation(key, sia_values, mag_sd, axis_sd, n_draws, seed, _df):
+    return simulate_measurement_noise(_df, sia_values, mag_sd, axis_sd, n_draws, seed=seed)
+
+
+def process_upload(data, sia_values, include_optimum, required_only, fmt, incremental=False, timer=None,
+                   result_dtype="float64", memory_budget=None, include_vectors=False, layout="wide"):
+    # Returns (result df, validation report, export bytes in fmt and layout), or None when required columns
+    # are missing. The returned df is always wide; the long layout is only built for the export.
+    timer = timer or RunTimer()
+    cache = upload_cache()
+    with timer.stage("cache lookup"):
+        key = batch_cache_key(data, sia_values, include_optimum, required_only, incremental, result_dtype,
+                              include_vectors)
+        result = cache.get(key)
+    if result is None:
+        with timer.stage("parse") as info:
+            df = read_batch_excel(data, required_only=required_only)
+            info["rows"] = len(df)
+        if missing_columns(df):
+            return None
+        with timer.stage("compute", len(df)):
+            if incremental:
+                df, report, stats = incremental_store().compute(df, sia_values, include_optimum=include_optimum,
+                                                                include_vectors=include_vectors)
+                report = dict(report, incremental=stats)
+            else:
+                df, invalid, report = validate_inputs(df)
+                df = compute_sia_errors_compact(df, sia_values, include_optimum=include_optimum, skip=invalid,
+                                                dtype=result_dtype, memory_budget=memory_budget,
+                                                include_vectors=include_vectors)
+        result = (df, report, {})
+    df, report, exports = result
+    if (fmt, layout) not in exports:
+        with timer.stage("export", len(df)):
+            export_df = decode_frame(df)
+            if layout == "long":
+                export_df = wide_to_long(export_df, sia_values)
+            exports[fmt, layout] = export_bytes(export_df, fmt)
+        cache.put(key, result)
+    return df, report, exports[fmt, layout]
+
+
+def render():
+    sia_values, _ = sia_grid_sidebar()
+    st.title("SIA Error Calculator (Batch Processing)")
+
+    # Provide a sample template for download
+    st.download_button(
+        label="Download Sample Template",
+        data=template_xlsx(),
+        file_name="SIA_Batch_Template.xlsx",
+        mime=XLSX_MIME
+    )
+
+    uploaded_file = st.file_uploader("Upload Excel file", type=["xlsx"])
+    include_optimum = st.checkbox("Add exact error-minimizing SIA columns")
+    keep_all_columns = st.checkbox("Keep all uploaded columns (slower to read)")
+    include_vectors = st.checkbox("Add error-vector columns (double-angle X/Y, error axis, WTR/ATR)")
+    incremental = st.checkbox("Incremental mode (only compute rows not seen in earlier uploads)")
+    download_format = st.radio("Download format", list(EXPORT_FORMATS), horizontal=True)
+    download_layout = st.radio("Download layout", LAYOUTS, horizontal=True,
+                               format_func={"wide": "Wide (one row per eye)",
+                                            "long": "Long (one row per eye and candidate SIA)"}.get)
+
+    with st.sidebar.expander("Performance"):
+        show_timings = st.checkbox("Show stage timings")
+        profile_run = st.checkbox("Profile the next batch run")
+    with st.sidebar.expander("Memory"):
+        result_dtype = st.radio("Result storage", RESULT_DTYPES, index=0,
+                                format_func={"float64": "float64 (exact)", "float32": "float32 (half size)",
+                                             "int16": "int16 centi-units (0.01 resolution)"}.get)
+        memory_budget = st.number_input("Memory budget (MB)", min_value=16, value=512, step=64)
+    timer = RunTimer()
+    if uploaded_file is not None:
+        upload_args = (uploaded_file.getvalue(), sia_values, include_optimum,
+                       not keep_all_columns, download_format, incremental, timer,
+                       result_dtype, memory_budget * 2**20, include_vectors, download_layout)
+        try:
+            if profile_run:
+                result, profile_dump, profile_report = profile_call(process_upload, *upload_args)
+                with st.sidebar.expander("Profile", expanded=True):
+                    st.download_button("Download profile (.prof)", data=profile_dump,
+                                       file_name="sia_batch.prof", mime="application/octet-stream")
+                    st.code(profile_report)
+            else:
+                result = process_upload(*upload_args)
+        except ValueError as exc:
+            # e.g. an uploaded column named ROW with the long layout
+            st.error(str(exc))
+            st.stop()
+        if result is None:
+            st.error(f"Excel must contain columns: {REQUIRED_COLS}")
+        else:
+            df, report, download_bytes = result
+            key = batch_cache_key(uploaded_file.getvalue(), sia_values, include_optimum, not keep_all_columns,
+                                  incremental, result_dtype, include_vectors)
+            if report["invalid"]:
+                st.warning(f"{report['invalid']} of {report['rows']} rows could not be computed and were "
+                           f"left blank; see the '{VALIDATION_COL}' column.")
+                with st.expander("Validation report"):
+                    st.json(report)
+                    st.dataframe(decode_frame(df[df[VALIDATION_COL] != ""].head(1000)))
+            if "incremental" in report:
+                st.caption(f"Incremental mode: reused {report['incremental']['reused']} rows, "
+                           f"computed {report['incremental']['computed']}.")
+            if report["normalized_axes"]:
+                st.info(f"{report['normalized_axes']} axis values outside 0-180° were normalized mod 180.")
+
+            st.subheader("Calculated SIA Errors")
+            error_cols = [c for c in df.columns if c.startswith(("SIA ERROR", "OPTIMAL SIA"))]
+            summary = result_summary(df, error_cols)
+            st.dataframe(summary.round(3))
+
+            # Only the visible page is sent to the browser; sort/filter run server-side
+            view_cols = st.columns(4)
+            sort_by = view_cols[0].selectbox("Sort by", ["(upload order)"] + error_cols + REQUIRED_COLS)
+            descending = view_cols[1].radio("Order", ["Ascending", "Descending"]) == "Descending"
+            filter_col = view_cols[2].selectbox("Filter on", ["(none)"] + error_cols)
+            page_size = view_cols[3].selectbox("Rows per page", [50, 100, 500, 1000], index=1)
+            filters = {}
+            if filter_col != "(none)":
+                low, high = float(summary.at[filter_col, "min"]), float(summary.at[filter_col, "max"])
+                if low < high:
+                    filters[filter_col] = st.slider(f"{filter_col} range (D)", low, high, (low, high))
+            order = row_order(df, filter_mask(df, filters),
+                              None if sort_by == "(upload order)" else sort_by, not descending)
+            n_pages = max(1, -(-len(order) // page_size))
+            page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)
+            page_df, page, n_pages = page_slice(df, order, page, page_size)
+            first_row = (page - 1) * page_size
+            st.caption(f"Showing rows {min(first_row + 1, len(order))}-{first_row + len(page_df)} of "
+                       f"{len(order)} matching ({len(df)} total)")
+            with timer.stage("render", len(page_df)):
+                st.dataframe(decode_frame(page_df))
+
+            st.download_button(label=f"Download {download_format} with SIA Errors",
+                               data=download_bytes,
+                               file_name=f"SIA_Errors_Filled.{download_format}",
+                               mime=EXPORT_FORMATS[download_format])
+
+            # Expander bodies run on every rerun even when collapsed, so the whole-cohort work is cached
+            with st.expander("Cohort Analytics"):
+                group_options = [c for c in df.columns
+                                 if c not in ("ACTUAL SIA MAGNITUDE", "ACTUAL SIA AXIS", VALIDATION_COL)
+                                 and not c.startswith(("SIA ERROR", "OPTIMAL SIA"))]
+                group_by = st.multiselect("Group by", group_options,
+                                          default=[c for c in ("SURGEON", "INCISION LOCATION") if c in group_options])
+                if not keep_all_columns:
+                    st.caption("Tick 'Keep all uploaded columns' to group by columns such as SURGEON.")
+                summary = cached_cohort_summary(key, tuple(group_by), sia_values, df)
+                st.dataframe(summary)
+                st.download_button(label="Download Cohort Summary (csv)",
+                                   data=summary.to_csv(index=False).encode("utf-8"),
+                                   file_name="SIA_Cohort_Summary.csv",
+                                   mime="text/csv")
+                st.image(cached_scatter_png(key, df))
+
+            with st.expander("Confidence Intervals and Measurement Noise"):
+                ci_cols = st.columns(4)
+                n_resamples = ci_cols[0].number_input("Resamples / draws", min_value=100, max_value=100_000,
+                                                      value=1000, step=100)
+                mag_sd = ci_cols[1].number_input("Magnitude noise SD (D)", min_value=0.0, value=0.25, step=0.05)
+                axis_sd = ci_cols[2].number_input("Axis noise SD (°)", min_value=0.0, value=5.0, step=1.0)
+                seed = ci_cols[3].number_input("Seed", min_value=0, value=0, step=1)
+                if st.checkbox("Compute (runs over the whole cohort)"):
+                    st.dataframe(cached_bootstrap(key, sia_values, n_resamples, seed, df))
+                    st.dataframe(cached_noise_simulation(key, sia_values, mag_sd, axis_sd, n_resamples, seed, df))
+
+    if show_timings and timer.stages:
+        with st.sidebar.expander("Stage Timings", expanded=True):
+            summary = timer.summary()
+            st.dataframe(pd.DataFrame(summary["stages"]).drop(columns="peak_bytes").set_index("stage"))
+            if summary["max_rss_bytes"]:
+                st.caption(f"Process peak RSS: {summary['max_rss_bytes'] / 2**20:.0f} MiB")
+            st.download_button("Download timings (JSON)", data=timer.to_json(indent=2),
+                               file_name="sia_batch_timings.json", mime="application/json")
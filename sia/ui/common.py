@@ -0,0 +1,18 @@
+"""Sidebar controls shared by the Single Case and Batch Processing modes."""
+import streamlit as st
+
+from ..grid import make_sia_grid
+
+
+def sia_grid_sidebar():
+    # Returns (candidate SIA values, decimals to print them with); stops the script on an invalid grid
+    with st.sidebar.expander("Candidate SIA Grid"):
+        grid_start = st.number_input("Grid Start (D)", min_value=0.0, value=0.0, step=0.1)
+        grid_stop = st.number_input("Grid Stop (D)", min_value=0.0, value=0.5, step=0.1)
+        grid_step = st.number_input("Grid Step (D)", min_value=0.001, value=0.1, step=0.001, format="%.3f")
+    if grid_stop < grid_start:
+        st.sidebar.error("Grid Stop must not be below Grid Start")
+        st.stop()
+    sia_values = make_sia_grid(grid_start, grid_stop, grid_step).tolist()
+    sia_decimals = max(1, len(f"{grid_step:g}".partition('.')[2]))
+    return sia_values, sia_decimals
@@ -0,0 +1,35 @@
+"""Copy-box mode (from appv9): fixed candidate grid with a tab-separated box for pasting into Excel."""
+import streamlit as st
+
+from ..batch import DEFAULT_SIA_VALUES
+from ..core import vector_difference_magnitude
+from ..grid import grid_extremes
+from ..plot import render_vector_png
+
+
+def copy_text(errors):
+    return "SIA Value\tError (D)\n" + "".join(f"{val:.1f}\t{err:.3f}\n" for val, err in errors.items())
+
+
+def render():
+    st.title("SIA Error Calculator (App v8 - RE Orientation)")
+
+    incision_axis = st.number_input("Incision Axis (degrees)", min_value=0.0, max_value=180.0, value=0.0)
+    expected_mag = st.number_input("Expected SIA Flattening Magnitude (D)", min_value=0.0, value=0.0, step=0.01)
+    actual_axis = st.number_input("Actual SIA Flattening Axis (degrees)", min_value=0.0, max_value=180.0, value=0.0)
+    actual_mag = st.number_input("Actual SIA Flattening Magnitude (D)", min_value=0.0, value=0.0, step=0.01)
+
+    sia_values = DEFAULT_SIA_VALUES
+    errors = dict(zip(sia_values, vector_difference_magnitude(actual_mag, actual_axis, sia_values,
+                                                              incision_axis).tolist()))
+    least_sia, _, most_sia, _ = grid_extremes(actual_mag, actual_axis, incision_axis, sia_values)
+
+    st.subheader("SIA Error Table")
+    for val, err in errors.items():
+        st.write(f"SIA {val:.1f} D: Error = {err:.3f} D")
+    st.markdown(f"**Least Error with SIA = {least_sia:.1f} D**", unsafe_allow_html=True)
+    st.markdown(f"<span style='color:red'>**Most Error with SIA = {most_sia:.1f} D**</span>", unsafe_allow_html=True)
+
+    st.text_area("Copy errors for Excel:", value=copy_text(errors), height=150)
+
+    st.image(render_vector_png(expected_mag, incision_axis, actual_mag, actual_axis))
@@ -0,0 +1,88 @@
+"""RE/LE orientation mode (from appv7): single-angle vectors mirrored for the left eye, with the limbus plot."""
+import numpy as np
+import streamlit as st
+
+from ..batch import DEFAULT_SIA_VALUES
+
+LIMBUS_RADIUS = 1.0
+PUPIL_RADIUS = 0.85
+IRIS_RADIUS = 0.95
+
+
+def sia_vector(magnitude, axis_deg, eye):
+    # Left eyes are mirrored about the vertical meridian
+    angle_rad = np.deg2rad(axis_deg if eye == "RE" else 180 - axis_deg)
+    return magnitude * np.cos(angle_rad), magnitude * np.sin(angle_rad)
+
+
+def eye_errors(actual_mag, actual_axis, incision_axis, eye, sia_values=DEFAULT_SIA_VALUES):
+    actual_x, actual_y = sia_vector(actual_mag, actual_axis, eye)
+    assumed_x, assumed_y = sia_vector(np.asarray(sia_values, dtype=float), incision_axis, eye)
+    return dict(zip(sia_values, np.round(np.hypot(actual_x - assumed_x, actual_y - assumed_y), 3).tolist()))
+
+
+def limbus_figure(eye, incision_axis, expected_mag, expected_axis, actual_mag, actual_axis):
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+
+    x_exp_tip, y_exp_tip = sia_vector(expected_mag, expected_axis, eye)
+    x_act_tip, y_act_tip = sia_vector(actual_mag, actual_axis, eye)
+    x_exp_base, y_exp_base = -x_exp_tip, -y_exp_tip
+    x_act_base, y_act_base = -x_act_tip, -y_act_tip
+    x_inc, y_inc = sia_vector(LIMBUS_RADIUS, incision_axis, eye)
+    label_x, label_y = sia_vector(LIMBUS_RADIUS + 0.1, incision_axis, eye)
+
+    fig = Figure(figsize=(7, 7))
+    ax = fig.subplots()
+    ax.set_aspect('equal')
+    ax.set_xlim(-1.3, 1.3)
+    ax.set_ylim(-1.3, 1.3)
+    ax.axis('off')
+
+    ax.add_artist(Circle((0, 0), IRIS_RADIUS, color='saddlebrown', fill=True, alpha=0.3))
+    ax.add_artist(Circle((0, 0), LIMBUS_RADIUS, color='black', fill=False, linewidth=2))
+    ax.add_artist(Circle((0, 0), PUPIL_RADIUS, edgecolor='black', facecolor='gold', linewidth=1.5, alpha=0.4))
+
+    ax.plot([-1.2, 1.2], [0, 0], linestyle='--', color='gray')
+    ax.plot([0, 0], [-1.2, 1.2], linestyle='--', color='gray')
+
+    ax.plot(x_inc, y_inc, marker='*', markersize=18, color='red', label='Incision')
+    ax.text(label_x, label_y, f"Incision @ {incision_axis}°", ha='center', va='center', fontsize=10, color='red')
+
+    ax.arrow(x_exp_base, y_exp_base, -x_exp_base, -y_exp_base, color='blue', width=0.01, length_includes_head=True, label='Expected SIA')
+    ax.arrow(x_act_base, y_act_base, -x_act_base, -y_act_base, color='green', width=0.01, length_includes_head=True, label='Actual SIA')
+    ax.plot([x_exp_base, x_act_base], [y_exp_base, y_act_base], color='red', linestyle='--', linewidth=2, label='Error Vector')
+
+    ax.text(x_exp_base * 1.1, y_exp_base * 1.1, 'Expected', color='blue', fontsize=10)
+    ax.text(x_act_base * 1.1, y_act_base * 1.1, 'Actual', color='green', fontsize=10)
+
+    ax.set_title(f"SIA Vector Plot ({eye})", fontsize=14)
+    ax.legend(loc='lower left')
+    return fig
+
+
+def render():
+    st.title("Surgically Induced Astigmatism (SIA) Error Calculator with Plot")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        eye = st.selectbox("Eye", ["RE", "LE"])
+        incision_axis = st.number_input("Incision Axis (degrees)", min_value=0.0, max_value=180.0, value=150.0)
+        actual_sia_axis = st.number_input("Actual SIA Flattened Axis (degrees)", min_value=0.0, max_value=180.0, value=30.0)
+        actual_sia_magnitude = st.number_input("Actual SIA Flattening Magnitude (D)", min_value=0.0, max_value=2.0, value=0.5)
+    with col2:
+        expected_sia_axis = st.number_input("Expected SIA Flattening Axis (degrees)", min_value=0.0, max_value=180.0, value=150.0)
+        expected_sia_magnitude = st.number_input("Expected SIA Flattening Magnitude (D)", min_value=0.0, max_value=2.0, value=0.3)
+
+    errors = eye_errors(actual_sia_magnitude, actual_sia_axis, incision_axis, eye)
+    best_sia = min(errors, key=errors.get)
+    worst_sia = max(errors, key=errors.get)
+
+    st.subheader("SIA Error Table")
+    st.dataframe({"Assumed SIA (D)": list(errors), "SIA Error": list(errors.values())})
+
+    st.markdown(f"✅ **Least SIA error if SIA taken as: {best_sia} D**", unsafe_allow_html=True)
+    st.markdown(f"❌ <span style='color:red'>Most SIA error if SIA taken as: {worst_sia} D</span>", unsafe_allow_html=True)
+
+    st.pyplot(limbus_figure(eye, incision_axis, expected_sia_magnitude, expected_sia_axis,
+                            actual_sia_magnitude, actual_sia_axis))
@@ -0,0 +1,54 @@
+"""Single Case mode: candidate SIA error table, exact optimum and eye diagram."""
+import numpy as np
+import streamlit as st
+
+from ..core import vector_difference_magnitude
+from ..grid import grid_extremes, optimal_sia
+from ..plot import render_vector_png, render_vector_svg
+from .common import sia_grid_sidebar
+
+
+@st.cache_data(max_entries=512)
+def single_case_errors(actual_mag, actual_axis, incision_axis, sia_values):
+    errors = vector_difference_magnitude(actual_mag, actual_axis, sia_values, incision_axis)
+    least_sia, _, most_sia, _ = grid_extremes(actual_mag, actual_axis, incision_axis, sia_values)
+    best_sia, best_err = optimal_sia(actual_mag, actual_axis, incision_axis, sia_values[0], sia_values[-1])
+    return dict(zip(sia_values, errors.tolist())), float(least_sia), float(most_sia), float(best_sia), float(best_err)
+
+
+@st.cache_data(max_entries=256)
+def eye_diagram_png(expected_mag, incision_axis, actual_mag, actual_axis):
+    # Only the vector overlay is redrawn; the eye background is reused by sia.plot
+    return render_vector_png(expected_mag, incision_axis, actual_mag, actual_axis)
+
+
+def render():
+    sia_values, sia_decimals = sia_grid_sidebar()
+    st.title("SIA Error Calculator (Single Case)")
+
+    incision_axis = st.number_input("Incision Axis (degrees)", min_value=0.0, max_value=180.0, value=0.0)
+    expected_mag = st.number_input("Expected SIA Flattening Magnitude (D)", min_value=0.0, value=0.0, step=0.01)
+    actual_axis = st.number_input("Actual SIA Flattening Axis (degrees)", min_value=0.0, max_value=180.0, value=0.0)
+    actual_mag = st.number_input("Actual SIA Flattening Magnitude (D)", min_value=0.0, value=0.0, step=0.01)
+
+    renderer = st.sidebar.radio("Diagram Renderer", ["Matplotlib", "SVG (lightweight)"])
+
+    errors, least_sia, most_sia, best_sia, best_err = single_case_errors(actual_mag, actual_axis,
+                                                                         incision_axis, sia_values)
+
+    st.subheader("SIA Error Table")
+    if len(errors) <= 11:
+        for val, err in errors.items():
+            st.write(f"SIA {val:.{sia_decimals}f} D: Error = {err:.3f} D")
+    else:
+        import pandas as pd
+
+        st.dataframe(pd.DataFrame({"SIA (D)": sia_values, "Error (D)": np.round(list(errors.values()), 3)}))
+    st.markdown(f"**Least Error with SIA = {least_sia:.{sia_decimals}f} D**", unsafe_allow_html=True)
+    st.markdown(f"<span style='color:red'>**Most Error with SIA = {most_sia:.{sia_decimals}f} D**</span>", unsafe_allow_html=True)
+    st.markdown(f"Exact error-minimizing SIA in grid range = {best_sia:.3f} D (Error = {best_err:.3f} D)")
+
+    if renderer == "Matplotlib":
+        st.image(eye_diagram_png(expected_mag, incision_axis, actual_mag, actual_axis))
+    else:
+        st.markdown(render_vector_svg(expected_mag, incision_axis, actual_mag, actual_axis), unsafe_allow_html=True)
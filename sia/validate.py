@@ -0,0 +1,67 @@
+"""Columnar validation and cleaning of batch inputs before the math.
+
+The whole frame is checked in one vectorized pass. Required columns are
+coerced to float64, axes are normalized mod 180, and every row that still
+can't be computed is flagged in a boolean mask with a readable reason, so
+the error columns for that row are left blank instead of failing the run.
+"""
+import numpy as np
+
+from .batch import REQUIRED_COLS
+
+VALIDATION_COL = "VALIDATION ERROR"
+MAGNITUDE_COL = "ACTUAL SIA MAGNITUDE"
+AXIS_COLS = ["INCISION LOCATION", "ACTUAL SIA AXIS"]
+
+
+def validate_inputs(df):
+    # Returns (cleaned df, invalid row mask, report dict); df itself is not modified
+    import pandas as pd
+
+    df = df.copy()
+    issues = {}
+    normalized_axes = 0
+    for col in REQUIRED_COLS:
+        raw = df[col]
+        values = pd.to_numeric(raw, errors="coerce").astype("float64")
+        missing = raw.isna().to_numpy()
+        issues[f"{col}: missing"] = missing
+        issues[f"{col}: not a number"] = values.isna().to_numpy() & ~missing
+        issues[f"{col}: not finite"] = np.isinf(values.to_numpy())
+        if col == MAGNITUDE_COL:
+            issues[f"{col}: negative"] = (values < 0).to_numpy()
+        elif col in AXIS_COLS:
+            wrapped = values.mod(180.0)
+            normalized_axes += int((np.isfinite(values) & (wrapped != values)).sum())
+            values = wrapped
+        df[col] = values
+
+    invalid = np.zeros(len(df), dtype=bool)
+    for mask in issues.values():
+        invalid |= mask
+    # Reason strings are only built for the flagged rows, so a few bad rows don't cost a pass over all of them
+    bad = np.flatnonzero(invalid)
+    labels = [(label, mask[bad]) for label, mask in issues.items() if mask.any()]
+    reasons = np.full(len(df), "", dtype=object)
+    reasons[bad] = ["; ".join(label for label, flags in labels if flags[j]) for j in range(len(bad))]
+    df[VALIDATION_COL] = pd.Series(reasons, index=df.index)
+
+    report = {
+        "rows": len(df),
+        "valid": int((~invalid).sum()),
+        "invalid": int(invalid.sum()),
+        "normalized_axes": normalized_axes,
+        "issues": {label: int(mask.sum()) for label, mask in issues.items() if mask.any()},
+    }
+    return df, invalid, report
+
+
+def accepted_rows(df):
+    # Rows validate_inputs accepts. Result frames that already carry VALIDATION ERROR are filtered on it;
+    # any other frame is validated first, so its required columns come back as float64.
+    if VALIDATION_COL in df.columns:
+        keep = (df[VALIDATION_COL].fillna("") == "").to_numpy()
+    else:
+        df, invalid, _ = validate_inputs(df)
+        keep = ~invalid
+    return df if keep.all() else df.iloc[np.flatnonzero(keep)]